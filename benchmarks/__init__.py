@@ -0,0 +1,13 @@
+"""
+Benchmarks
+==========
+
+Throughput and latency benchmarks of `ParsNorm.normalize` on a deterministic
+synthetic corpus. Run from the repository root::
+
+    python -m benchmarks
+
+See `benchmarks.corpus` for the corpus generator and `benchmarks.runner` for
+the measurements.
+
+"""
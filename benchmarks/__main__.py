@@ -0,0 +1,65 @@
+"""
+Command line entry point of the benchmark suite.
+
+Examples
+--------
+Measure the default and custom option sets and keep the results::
+
+    python -m benchmarks --sets default custom --json bench.json
+
+Compare a branch against saved results, failing on a regression over 10%::
+
+    python -m benchmarks --baseline bench.json --tolerance 0.1
+
+"""
+import sys
+import json
+import argparse
+from benchmarks.runner import OPTION_SETS, run, compare, format_table
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Measure ParsNorm.normalize throughput on a synthetic corpus.")
+    parser.add_argument("--sets", nargs="+", default=list(OPTION_SETS), choices=OPTION_SETS, metavar="SET",
+                        help=f"option sets to measure (default: all of {', '.join(OPTION_SETS)})")
+    parser.add_argument("-n", type=int, default=1000, help="number of utterances in the corpus")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the corpus and of random templates")
+    parser.add_argument("--warmup", type=int, default=20, help="utterances normalized before timing")
+    parser.add_argument("--repeat", type=int, default=1, help="passes over the corpus")
+    parser.add_argument("--no-isolate", action="store_true",
+                        help="measure in this process instead of a fresh one per option set")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results of an earlier --json run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="relative slowdown tolerated before --baseline fails (default: 0.1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run(args.sets, n=args.n, seed=args.seed, warmup=args.warmup, repeat=args.repeat,
+                  isolate=not args.no_isolate)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+    print(format_table(results, baseline))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump({"n": args.n, "seed": args.seed, "repeat": args.repeat, "python": sys.version.split()[0],
+                       "results": results}, output, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for name, metric, old, new, change in regressions:
+            print(f"regression: {name} {metric} {old:,.2f} -> {new:,.2f} ({change:+.1%})", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
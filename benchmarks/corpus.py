@@ -0,0 +1,112 @@
+"""
+Synthetic Persian corpus
+========================
+
+Generates a deterministic corpus of utterances that exercise every stage of
+`ParsNorm.normalize`: Persian prose with Arabic presentation forms and
+letters, English words, numbers, decimals, dates in all three calendars,
+times, phone numbers, URLs, emails, abbreviations and symbols. The same
+seed always yields the same corpus, so numbers measured on different
+revisions are comparable.
+
+The corpus can also be written out for other tools::
+
+    python -m benchmarks.corpus -n 10000 --seed 0 > corpus.txt
+
+"""
+import random
+import argparse
+
+PERSIAN_WORDS = (
+    "سلام", "دنیا", "کتاب", "خانه", "مدرسه", "دانشگاه", "تهران", "ایران", "قانون", "دادگاه", "روز", "سال",
+    "ماه", "هفته", "امروز", "فردا", "دیروز", "ما", "شما", "آنها", "است", "بود", "خواهد", "شد", "می‌شود",
+    "کرد", "گفت", "رفت", "آمد", "برای", "از", "به", "در", "با", "که", "این", "آن", "را", "و", "یا",
+    "دولت", "مجلس", "وزیر", "رئیس", "جمهور", "اقتصاد", "بازار", "قیمت", "دلار", "تومان", "خبرگزاری",
+    "گزارش", "پژوهش", "دانشجو", "استاد", "بیمارستان", "پزشک", "شهر", "کشور", "جهان", "مردم", "زندگی",
+    "کتاب‌ها", "نمی‌دانم", "خانه‌ای", "تلفن", "فکس", "شماره", "تماس", "ساعت", "تاریخ", "درصد",
+)
+ARABIC_FORMS = ("ﻻ", "ﷲ", "ﮐﺘﺎﺏ", "ﻣﺤﻤﺪ", "ﺳﻼﻡ", "ي", "ك", "ة", "علي", "كتاب", "١٢٣", "٤٥٦")
+ENGLISH_WORDS = (
+    "instagram", "iPhone", "ok", "google", "online", "email", "Samsung", "football", "project", "update",
+    "download", "software", "meeting", "Windows", "Android", "YouTube", "podcast", "startup", "design",
+)
+ABBREVIATIONS = (
+    "ه.ش.", "ه.ق", "ق.م.", "ق.م", "ق.م.ف.", "ق.ا.ا.م", "(ع)", "(ص)", "(ره)", "ج.ا.ا.", "ر.ک.", "ن.ک.ص",
+)
+LINKS = (
+    "www.google.com", "https://example.org/path", "http://news.example.ir/fa/news/123", "ali@example.com",
+    "info@example.ir",
+)
+SYMBOLS = ("%", "$", "€", "°C", "؟؟؟", "!!!", "…", "—", "‌", "‍", "½", "«", "»", "،", "؛", "...")
+
+
+def _number(rng):
+    kind = rng.random()
+    if kind < 0.5:
+        return str(rng.randint(0, 999))
+    if kind < 0.7:
+        return str(rng.randint(1000, 10 ** 7))
+    if kind < 0.8:
+        return f"{rng.randint(0, 999)}.{rng.randint(0, 99)}"
+    if kind < 0.9:
+        return f"{rng.randint(1, 99)}-{rng.randint(1, 99)}"
+    return f"{rng.randint(1, 999)}٬{rng.randint(0, 999):03d}"
+
+
+def _date(rng):
+    year = rng.choice((rng.randint(1300, 1403), rng.randint(1990, 2025), rng.randint(1400, 1446)))
+    month, day = rng.randint(1, 12), rng.randint(1, 29)
+    separator = rng.choice("/-.")
+    if rng.random() < 0.8:
+        return f"{year}{separator}{month}{separator}{day}"
+    return f"{day}{separator}{month}{separator}{year}"
+
+
+def _time(rng):
+    if rng.random() < 0.5:
+        return f"{rng.randint(0, 23)}:{rng.randint(0, 59):02d}"
+    return f"{rng.randint(0, 23)}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+
+
+def _phone(rng):
+    number = rng.choice(("0912", "0935", "021", "0311")) + "".join(rng.choice("0123456789") for _ in range(7))
+    return rng.choice(("تلفن: ", "تلفن ", "شماره تماس: ", "فکس ", "")) + number
+
+
+# relative weights of the kinds of tokens; prose dominates as in real transcripts
+TOKEN_KINDS = (
+    (55, lambda rng: rng.choice(PERSIAN_WORDS)),
+    (5, lambda rng: rng.choice(ARABIC_FORMS)),
+    (8, lambda rng: rng.choice(ENGLISH_WORDS)),
+    (10, _number),
+    (4, _date),
+    (4, _time),
+    (3, _phone),
+    (2, lambda rng: rng.choice(LINKS)),
+    (4, lambda rng: rng.choice(ABBREVIATIONS)),
+    (5, lambda rng: rng.choice(SYMBOLS)),
+)
+
+
+def generate_corpus(n=1000, seed=0, min_tokens=5, max_tokens=40):
+    """
+    Returns `n` synthetic utterances of `min_tokens` to `max_tokens` tokens.
+    The output depends only on the arguments.
+    """
+    rng = random.Random(seed)
+    weights = [weight for weight, _ in TOKEN_KINDS]
+    kinds = [kind for _, kind in TOKEN_KINDS]
+    corpus = []
+    for _ in range(n):
+        length = rng.randint(min_tokens, max_tokens)
+        corpus.append(" ".join(kind(rng) for kind in rng.choices(kinds, weights, k=length)))
+    return corpus
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.corpus",
+                                     description="Print a synthetic Persian corpus, one utterance per line.")
+    parser.add_argument("-n", type=int, default=1000, help="number of utterances")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    print("\n".join(generate_corpus(args.n, args.seed)))
@@ -0,0 +1,142 @@
+"""
+Throughput benchmark for `ParsNorm.normalize`
+=============================================
+
+Every option set is measured in a fresh process, so peak RSS is that of a
+process normalizing with those options and not an accumulation of earlier
+runs. Reported metrics:
+
+chars_per_s, utterances_per_s
+    Input characters and utterances normalized per second of wall time.
+p50_ms, p99_ms, max_ms
+    Per-utterance latency percentiles.
+peak_rss_mb
+    Peak resident set size of the measuring process.
+
+"""
+import sys
+import time
+import random
+import multiprocessing
+
+# Option sets passed to `ParsNorm.normalize`; "default" uses no arguments.
+OPTION_SETS = {
+    "default": {},
+    "custom": {"convert_date": True, "english_correction": True, "hazm": False, "remove_punct": False},
+    "minimal": {"convert_time": False, "number_conversion": False, "en_fa_transliteration": False,
+                "hazm": False},
+}
+
+# Metrics where a higher value is better; any other metric is better lower.
+HIGHER_IS_BETTER = {"chars_per_s", "utterances_per_s"}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def measure(texts, options, warmup=20, repeat=1, seed=0):
+    """
+    Normalizes `texts` `repeat` times with `options` in this process and
+    returns the metrics. The first `warmup` texts are normalized beforehand
+    and not timed, so lazy loading and plan compilation are excluded.
+    """
+    from parsnorm import ParsNorm
+    normalizer = ParsNorm()
+    for text in texts[:warmup]:
+        normalizer.normalize(text, **options)
+
+    # date and number templates are picked at random; fix them per run
+    random.seed(seed)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            normalizer.normalize(text, **options)
+            latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    n_chars = sum(map(len, texts)) * repeat
+    return {
+        "utterances": len(latencies),
+        "chars_per_s": n_chars / elapsed,
+        "utterances_per_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _measure_corpus(n, seed, options, warmup, repeat):
+    from benchmarks.corpus import generate_corpus
+    return measure(generate_corpus(n, seed), options, warmup, repeat, seed)
+
+
+def run(option_sets, n=1000, seed=0, warmup=20, repeat=1, isolate=True):
+    """
+    Measures every named option set in `option_sets` on a corpus of `n`
+    utterances and returns ``{name: metrics}``. With `isolate` each set runs
+    in its own freshly spawned process.
+    """
+    results = {}
+    for name in option_sets:
+        args = (n, seed, OPTION_SETS[name], warmup, repeat)
+        if isolate:
+            with multiprocessing.get_context("spawn").Pool(1) as pool:
+                results[name] = pool.apply(_measure_corpus, args)
+        else:
+            results[name] = _measure_corpus(*args)
+    return results
+
+
+def compare(results, baseline, tolerance=0.1):
+    """
+    Returns ``(name, metric, old, new, change)`` for every metric that got
+    worse than `baseline` by more than `tolerance`, a fraction.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, new in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if metric == "utterances" or not old or new is None:
+                continue
+            change = new / old - 1
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            if worse > tolerance:
+                regressions.append((name, metric, old, new, change))
+    return regressions
+
+
+def format_table(results, baseline=None):
+    columns = ["chars_per_s", "utterances_per_s", "p50_ms", "p99_ms", "max_ms", "peak_rss_mb"]
+    rows = [["options"] + columns]
+    for name, metrics in results.items():
+        row = [name]
+        for column in columns:
+            value = metrics[column]
+            cell = "-" if value is None else f"{value:,.0f}" if value >= 100 else f"{value:.2f}"
+            old = (baseline or {}).get(name, {}).get(column)
+            if old and value is not None:
+                cell += f" ({value / old - 1:+.1%})"
+            row.append(cell)
+        rows.append(row)
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns) + 1)]
+    lines = ["  ".join(cell.rjust(width) if i else cell.ljust(width) for i, (cell, width) in enumerate(zip(row, widths)))
+             for row in rows]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
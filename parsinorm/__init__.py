@@ -1,8 +1,31 @@
-from .mail_url_cleaner  import Mail_url_cleaner 
-from .date_time_to_text import Date_time_to_text
-from .general_normalization import General_normalization
-from .telephone_number import Telephone_number
-from .abbreviation import Abbreviation
-from .tts_normalization import TTS_normalization
-from .special_numbers import Special_numbers
-from .tokenizer import Tokenizer
\ No newline at end of file
+import importlib
+
+# Classes are imported on first access (PEP 562); the tokenizer in particular
+# pulls in hazm's POS tagger, which most users of this package never need.
+_LAZY_ATTRIBUTES = {
+    "Mail_url_cleaner": ".mail_url_cleaner",
+    "Date_time_to_text": ".date_time_to_text",
+    "General_normalization": ".general_normalization",
+    "Telephone_number": ".telephone_number",
+    "Abbreviation": ".abbreviation",
+    "TTS_normalization": ".tts_normalization",
+    "Special_numbers": ".special_numbers",
+    "Tokenizer": ".tokenizer",
+    "Template_selector": ".template_selector",
+    "Character_filter": ".character_filter",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -286,6 +286,10 @@ class Abbreviation:
             self.other37, self.other38, self.other39, self.other40, self.other41, self.other42
         ]
 
+        # the passes of every combination of enabled tables, built on first use
+        self.replacers = {}
+        self.sentence_end_pattern = re.compile(r'\s*$')
+
         self.match_sound_replace = {
             "A": "آ ",
             "a": "آ ",
@@ -341,35 +345,63 @@ class Abbreviation:
             "z": "زد ",
         }
 
-    def replace_date_abbreviation(self, sentence):
-        for date_replace in self.date_replaces:
-            sentence = re.sub('({})'.format('|'.join(map(re.escape, date_replace.keys()))),
-                              lambda m: date_replace[m.group()], sentence)
+    def replacer(self, date=True, persian_label=True, law=True, book=True, other=True):
+        """
+        Returns the passes that replace the abbreviations of the enabled
+        tables, as ``(abbreviation, pattern, replace)`` triples in the order of
+        the old one-entry dicts: date, persian label, law, book, other, each
+        table in list order. Running them in turn gives the old priorities,
+        so 'ق.م' is still read before 'ق.م.' or 'ق.م.ف.'; a pass only has to
+        run on sentences that contain its abbreviation.
+        """
+        key = (date, persian_label, law, book, other)
+        if key not in self.replacers:
+            tables = []
+            if date:
+                tables.extend(self.date_replaces)
+            if persian_label:
+                tables.extend(self.persain_label_replaces)
+            if law:
+                tables.extend(self.law_replaces)
+            if book:
+                tables.extend(self.book_replaces)
+            if other:
+                tables.extend(self.other_replaces)
+            replaces = {}
+            for table in tables:
+                for abbreviation, expansion in table.items():
+                    replaces.setdefault(abbreviation, expansion)
+            self.replacers[key] = [(abbreviation, re.compile(re.escape(abbreviation)),
+                                    lambda match, expansion=expansion: self.expand(match, expansion))
+                                   for abbreviation, expansion in replaces.items()]
+        return self.replacers[key]
+
+    def expand(self, match, expansion):
+        # the dot of an abbreviation that ends the sentence is also its full stop
+        if match.group().endswith('.') and self.sentence_end_pattern.match(match.string, match.end()):
+            return expansion + '.'
+        return expansion
+
+    def replace_abbreviations(self, sentence, date=True, persian_label=True, law=True, book=True, other=True):
+        for abbreviation, pattern, replace in self.replacer(date, persian_label, law, book, other):
+            if abbreviation in sentence:
+                sentence = pattern.sub(replace, sentence)
         return sentence
 
+    def replace_date_abbreviation(self, sentence):
+        return self.replace_abbreviations(sentence, persian_label=False, law=False, book=False, other=False)
+
     def replace_persian_label_abbreviation(self, sentence):
-        for persain_label_replace in self.persain_label_replaces:
-            sentence = re.sub('({})'.format('|'.join(map(re.escape, persain_label_replace.keys()))),
-                              lambda m: persain_label_replace[m.group()], sentence)
-        return sentence
+        return self.replace_abbreviations(sentence, date=False, law=False, book=False, other=False)
 
     def replace_law_abbreviation(self, sentence):
-        for law_replace in self.law_replaces:
-            sentence = re.sub('({})'.format('|'.join(map(re.escape, law_replace.keys()))),
-                              lambda m: law_replace[m.group()], sentence)
-        return sentence
+        return self.replace_abbreviations(sentence, date=False, persian_label=False, book=False, other=False)
 
     def replace_book_abbreviation(self, sentence):
-        for book_replace in self.book_replaces:
-            sentence = re.sub('({})'.format('|'.join(map(re.escape, book_replace.keys()))),
-                              lambda m: book_replace[m.group()], sentence)
-        return sentence
+        return self.replace_abbreviations(sentence, date=False, persian_label=False, law=False, other=False)
 
     def replace_other_abbreviation(self, sentence):
-        for other_replace in self.other_replaces:
-            sentence = re.sub('({})'.format('|'.join(map(re.escape, other_replace.keys()))),
-                              lambda m: other_replace[m.group()], sentence)
-        return sentence
+        return self.replace_abbreviations(sentence, date=False, persian_label=False, law=False, book=False)
 
     def replace_English_abbrevations(self, sentence):
         pattern_one = r"\b[A-Za-z](?=([.]))(?:\1[A-Za-z])+\b"
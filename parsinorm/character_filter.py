@@ -0,0 +1,40 @@
+import re
+
+
+class Character_filter:
+    """
+    Replaces every character outside an allowed set by `replacement` in one
+    pass.
+
+    allowed
+        The allowed characters as the body of a regex character class, so
+        ranges such as "۰-۹" are understood. The class is compiled once; its
+        charset is the lookup table the scan runs on.
+    substitutions
+        Optional dict of single characters to replace before filtering.
+    """
+    def __init__(self, allowed, replacement=" ", substitutions=None):
+        self.allowed = allowed
+        self.replacement = replacement
+        self.pattern = re.compile(f"[^{allowed}]")
+        self.substitutions = substitutions or {}
+        # most texts contain none of the substituted characters, which a regex
+        # skips far faster than `str.translate` walks a non-ASCII text
+        self.substitution_pattern = re.compile(
+            "[{}]".format("".join(map(re.escape, self.substitutions)))) if self.substitutions else None
+
+    @classmethod
+    def from_characters(cls, characters, replacement=" ", substitutions=None):
+        """Builds a filter allowing exactly the given characters."""
+        return cls("".join(re.escape(character) for character in characters), replacement, substitutions)
+
+    def substitute(self, text):
+        if self.substitution_pattern is None:
+            return text
+        return self.substitution_pattern.sub(lambda match: self.substitutions[match.group()], text)
+
+    def __call__(self, text):
+        return self.pattern.sub(self.replacement, self.substitute(text))
+
+    def __contains__(self, character):
+        return self.pattern.match(character) is None
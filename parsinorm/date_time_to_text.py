@@ -1,12 +1,15 @@
 import re
-import random
-from num2fawords import words, HUNDREDS, ordinal_words
+import string
+import functools
+from .number_words import words, HUNDREDS, ordinal_words
 from persian_tools import digits
+from .template_selector import Template_selector
 
 
 class Date_time_to_text:
 
-    def __init__(self):
+    def __init__(self, template_selector=None):
+        self.template_selector = template_selector or Template_selector()
         self.english_digits = '0123456789'
         self.persian_digits = '۰۱۲۳۴۵۶۷۸۹'
         self.shamsi_month = {
@@ -90,91 +93,107 @@ class Date_time_to_text:
             "۱۹": ['⒆', '⒚', '⑲'],
             "۲۰": ['⒇', '⒛', '⑳'],
         }
+        # every wrong form has one correct form, so one table replaces them all
+        self.number_table = {ord(wrong_character): correct_form
+                             for correct_form, wrong_forms in self.number_replaces.items()
+                             for wrong_character in wrong_forms}
+        self.english_digits_table = str.maketrans(digits.SUPPORTED_CHARS["fa"] + digits.SUPPORTED_CHARS["ar"],
+                                                  self.english_digits * 2)
 
-    def number_correction(self, word):
-        for correct_form, wrong_forms in self.number_replaces.items():
-            for wrong_character in wrong_forms:
-                word = word.replace(wrong_character, correct_form)
-        return word
+        # a date is three numbers joined by slashes, which may have a space on
+        # either side, by dots or by hyphens, the same separator twice
+        self.date_pattern = re.compile(r'(?P<first>\d+)(?:(?P<slash>\s?/\s?)|(?P<dot>\.)|-)(?P<second>\d+)'
+                                       r'(?(slash)\s?/\s?|(?(dot)\.|-))(?P<third>\d+)')
+        # readings are memoized by (calendar, year, month, day) when they do
+        # not change from one call to the next
+        self.memoized_template_type = functools.lru_cache(maxsize=4096)(self.define_template_type)
 
-    def select_templates_time_three(self, hour, minute, second):
-        time_tempaltes = {
-            0: f"{words(hour)} و {words(minute)} دقیقه و  {words(second)} ثانیه",
-        }
-        time_tempaltes_no_minute = {
-            0: f"{words(hour)} و {words(second)} ثانیه",
-        }
-        time_tempaltes_no_second = {
-            0: f"{words(hour)} و {words(minute)} دقیقه",
-            1: f"{words(hour)} و {words(minute)}",
-        }
-        time_tempaltes_no_second_no_minute = {
-            0: f"{words(hour)}",
-        }
-        bamdad_tempaltes = {
-            0: f"{words(minute)} دقیقه و  {words(second)} ثانیه بامداد",
-        }
-        bamdad_tempaltes_no_minute = {
-            0: f"{words(second)} ثانیه بامداد",
+        self.calendar_months = {"Shamsi": self.shamsi_month, "Ghamari": self.ghamari_month,
+                                "Miladi": self.miladi_month}
+        # month numbers are the same in every calendar, so their words are
+        # computed once here; days and years are cached as they are met
+        self.month_letters = {month: self.ConvertNumberToLetter(month) for month in self.shamsi_month}
+        self.number_letters = functools.lru_cache(maxsize=4096)(self.ConvertNumberToLetter)
+        self.ordinal_letters = functools.lru_cache(maxsize=1024)(ordinal_words)
+        # only the fields of the chosen template are rendered
+        self.date_templates = [
+            "{ordinal_day} {month_name} سال {year}",
+            "{ordinal_day} {month} سال {year}",
+            "{day} {month_name} سال {year}",
+            "{day} {month_name} ماه سال {year}",
+            "{ordinal_day}  {month_name} ماه {year}",
+            "{day}  {month_name} ماه {year}",
+            "{ordinal_day} {month_name} {year}",
+            "{ordinal_day} {month} {year}",
+            "{day} {month_name} {year}",
+            "{day} {month} {year}",
+        ]
+        self.date_template_fields = [[field for _, field, _, _ in string.Formatter().parse(template) if field]
+                                     for template in self.date_templates]
+
+        # time templates by which of the hour, minute and second are not zero
+        self.time_three_templates = {
+            (True, True, True): ["{hour} و {minute} دقیقه و  {second} ثانیه"],
+            (True, False, True): ["{hour} و {second} ثانیه"],
+            (True, True, False): ["{hour} و {minute} دقیقه", "{hour} و {minute}"],
+            (True, False, False): ["{hour}"],
+            (False, True, True): ["{minute} دقیقه و  {second} ثانیه بامداد"],
+            (False, False, True): ["{second} ثانیه بامداد"],
+            (False, True, False): ["{minute} دقیقه بامداد"],
+            (False, False, False): ["بامداد"],
         }
-        bamdad_tempaltes_no_second = {
-            0: f"{words(minute)} دقیقه بامداد",
+        self.time_two_templates = {
+            (True, True): ["{hour} و {minute} دقیقه  ", "{hour} و {minute} "],
+            (True, False): ["{hour}"],
+            (False, True): ["{minute} دقیقه  بامداد"],
+            (False, False): ["بامداد"],
         }
-        if hour != 0 and minute != 0 and second != 0:
-            return time_tempaltes.get(0)
-        if hour != 0 and minute == 0 and second != 0:
-            return time_tempaltes_no_minute.get(0)
-        if hour != 0 and minute != 0 and second == 0:
-            template_no = random.randint(0, 1)
-            return time_tempaltes_no_second.get(template_no)
-        if hour != 0 and minute == 0 and second == 0:
-            return time_tempaltes_no_second_no_minute.get(0)
-        if hour == 0 and minute != 0 and second != 0:
-            return bamdad_tempaltes.get(0)
-        if hour == 0 and minute == 0 and second != 0:
-            return bamdad_tempaltes_no_minute.get(0)
-        if hour == 0 and minute != 0 and second == 0:
-            return bamdad_tempaltes_no_second.get(0)
-        if hour == 0 and minute == 0 and second == 0:
-            return "بامداد"
+        self.time_pattern = re.compile(r'(\d+):(\d+)(?::(\d+))?')
+        # readings of the times met so far by (hour, minute, second, template),
+        # second being None for "hour:minute"; there are at most 24 * 60 * 60
+        # times, so the table stays small
+        self.time_texts = {}
+
+    def number_correction(self, word):
+        return word.translate(self.number_table)
+
+    def select_templates_time_three(self, hour, minute, second):
+        templates = self.time_three_templates[hour != 0, minute != 0, second != 0]
+        template_no = 0
+        if len(templates) > 1:
+            template_no = self.template_selector.choose(len(templates), f"{hour}:{minute}:{second}")
+        return self.time_text(templates, template_no, hour, minute, second)
 
     def select_templates_time_two(self, hour, minute):
-        time_tempaltes = {
-            0: f"{words(hour)} و {words(minute)} دقیقه  ",
-            1: f"{words(hour)} و {words(minute)} ",
-        }
-        time_tempaltes_no_minute = {
-            0: f"{words(hour)}",
-        }
-        bamdad_tempaltes = {
-            0: f"{words(minute)} دقیقه  بامداد",
-        }
-        if hour != 0 and minute != 0:
-            template_no = random.randint(0, 1)
-            return time_tempaltes.get(template_no)
-        if hour != 0 and minute == 0:
-            return time_tempaltes_no_minute.get(0)
-        if hour == 0 and minute != 0:
-            return bamdad_tempaltes.get(0)
-        if hour == 0 and minute == 0:
-            return "بامداد"
+        templates = self.time_two_templates[hour != 0, minute != 0]
+        template_no = 0
+        if len(templates) > 1:
+            template_no = self.template_selector.choose(len(templates), f"{hour}:{minute}")
+        return self.time_text(templates, template_no, hour, minute)
+
+    def time_text(self, templates, template_no, hour, minute, second=None):
+        key = (hour, minute, second, template_no)
+        text = self.time_texts.get(key)
+        if text is None:
+            parts = {"hour": words(hour), "minute": words(minute)}
+            if second is not None:
+                parts["second"] = words(second)
+            text = self.time_texts[key] = templates[template_no].format(**parts)
+        return text
 
     def time_to_text(self, sentence):
-        matches = re.findall(r'(\d+:\d+:\d+)', sentence)
-        for match in matches:
-            hour = int(match.split(':')[0])
-            minute = int(match.split(':')[1])
-            second = int(match.split(':')[2])
-            if hour <= 23 and minute <= 59 and second <= 59:
-                sentence = sentence.replace(match, self.select_templates_time_three(hour, minute, second))
-        matches = re.findall(r'(\d+:\d+)', sentence)
-        for match in matches:
-            hour = int(match.split(':')[0])
-            minute = int(match.split(':')[1])
-            if hour <= 23 and minute <= 59:
-                sentence = sentence.replace(match, self.select_templates_time_two(hour, minute))
+        return self.time_pattern.sub(self.time_match_to_text, sentence)
 
-        return sentence
+    def time_match_to_text(self, match):
+        hour, minute = int(match.group(1)), int(match.group(2))
+        if match.group(3) is not None:
+            second = int(match.group(3))
+            if hour <= 23 and minute <= 59 and second <= 59:
+                return self.select_templates_time_three(hour, minute, second)
+        if hour <= 23 and minute <= 59:
+            # a valid hour and minute are read even before an invalid second
+            return self.select_templates_time_two(hour, minute) + match.group()[match.end(2) - match.start():]
+        return match.group()
 
     def ConvertNumberToLetter(self, line):
         newline = ''
@@ -212,172 +231,62 @@ class Date_time_to_text:
             return "Shamsi"
 
     def select_templates_date(self, month_name, year, month, day):
-        template_no = random.randint(0, 9)
-        switcher = {
-            0: f"{ordinal_words(day)} {month_name[month]} سال {self.ConvertNumberToLetter(year)}",
-            1: f"{ordinal_words(day)} {self.ConvertNumberToLetter(month)} سال {self.ConvertNumberToLetter(year)}",
-            2: f"{self.ConvertNumberToLetter(day)} {month_name[month]} سال {self.ConvertNumberToLetter(year)}",
-            3: f"{self.ConvertNumberToLetter(day)} {month_name[month]} ماه سال {self.ConvertNumberToLetter(year)}",
-            4: f"{ordinal_words(day)}  {month_name[month]} ماه {self.ConvertNumberToLetter(year)}",
-            5: f"{self.ConvertNumberToLetter(day)}  {month_name[month]} ماه {self.ConvertNumberToLetter(year)}",
-            6: f"{ordinal_words(day)} {month_name[month]} {self.ConvertNumberToLetter(year)}",
-            7: f"{ordinal_words(day)} {self.ConvertNumberToLetter(month)} {self.ConvertNumberToLetter(year)}",
-            8: f"{self.ConvertNumberToLetter(day)} {month_name[month]} {self.ConvertNumberToLetter(year)}",
-            9: f"{self.ConvertNumberToLetter(day)} {self.ConvertNumberToLetter(month)} {self.ConvertNumberToLetter(year)}",
+        template_no = self.template_selector.choose(len(self.date_templates), f"{year}/{month}/{day}")
+        fields = {
+            "ordinal_day": lambda: self.ordinal_letters(day),
+            "day": lambda: self.number_letters(day),
+            "month_name": lambda: month_name[month],
+            "month": lambda: self.month_letters.get(month) or self.number_letters(month),
+            "year": lambda: self.number_letters(year),
         }
-        return switcher.get(template_no)
+        return self.date_templates[template_no].format(
+            **{field: fields[field]() for field in self.date_template_fields[template_no]})
 
     def define_template_type(self, date_type, year, month, day):
-        if date_type == "Shamsi":
-            return self.select_templates_date(self.shamsi_month, year, month, day)
-        elif date_type == "Ghamari":
-            return self.select_templates_date(self.ghamari_month, year, month, day)
-        elif date_type == "Miladi":
-            return self.select_templates_date(self.miladi_month, year, month, day)
+        month_name = self.calendar_months.get(date_type)
+        if month_name is not None:
+            return self.select_templates_date(month_name, year, month, day)
 
     def date_to_text(self, sentence):
-        match = None
-        sentence = digits.convert_to_en(sentence)
-        match_main = re.search(r'(\d+\/\d+\/\d+)', sentence)
-        match1 = re.search(r'(\d+\s/\s\d+\s/\s\d+)', sentence)
-        match1_1 = re.search(r'(\d+\s/\d+/\d+)', sentence)
-        match1_2 = re.search(r'(\d+/\d+/\s\d+)', sentence)
-        match1_3 = re.search(r'(\d+/\s\d+/\s\d+)', sentence)
-        match2 = re.search(r'(\d+/\s\d+/\s\d+)', sentence)
-        match3 = re.search(r'(\d+\.\d+\.\d+)', sentence)
-        match4 = re.search(r'(\d+-\d+-\d+)', sentence)
-        if match_main:
-            match_form = match_main.group()
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match_main.group()
-        if match1:
-            match_form = match1.group()
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match1.group()
-        elif match2:
-            sentence = sentence.replace(match2.group(), match2.group().replace("-", "/"))
-            match_form = match2.group().replace("-", "/")
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match2.group().replace("-", "/")
-        elif match3:
-            sentence = sentence.replace(match3.group(), match3.group().replace(".", "/"))
-            match_form = match3.group().replace(".", "/")
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match3.group().replace(".", "/")
-        elif match4:
-            sentence = sentence.replace(match4.group(), match4.group().replace("-", "/"))
-            match_form = match4.group().replace("-", "/")
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match4.group().replace("-", "/")
-        elif match1_1:
-            match_form = match1_1.group()
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match1_1.group()
-        elif match1_2:
-            match_form = match1_2.group()
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match1_2.group()
-        elif match1_3:
-            match_form = match1_3.group()
-            splited_date = match_form.split("/")
-            part1 = int(splited_date[0])
-            part2 = int(splited_date[1])
-            part3 = int(splited_date[2])
-            if part1 < 1 or part2 < 1 or part3 < 1:
-                match = None
-            else:
-                match = match1_3.group()
-        if match:
-            splited_date = match.split("/")
-            splited_date_len = [len(part) for part in splited_date]
-            if 4 == splited_date_len[0] and int(splited_date[1]) <= 12:
-                # year4d/month/day
-                year = splited_date[0]
-                month = str(int(splited_date[1]))
-                day = splited_date[2]
-                date_type = self.define_date_type(year)
-                sentence = sentence.replace(match, self.define_template_type(date_type, year, month, day))
-            elif int(splited_date[1]) >= 7 and int(splited_date[1]) <= 12 and int(splited_date[0]) > 31:
-                # year2d/month/day
-                year = splited_date[0]
-                month = str(int(splited_date[1]))
-                day = splited_date[2]
-                date_type = self.define_date_type(year)
-                sentence = sentence.replace(match, self.define_template_type(date_type, year, month, day))
-            elif int(splited_date[1]) <= 6 and int(splited_date[1]) <= 12 and int(splited_date[0]) >= 31:
-                # year2d/month/day
-                year = splited_date[0]
-                month = str(int(splited_date[1]))
-                day = str(int(splited_date[2]))
-                date_type = self.define_date_type(year)
-                sentence = sentence.replace(match, self.define_template_type(date_type, year, month, day))
-            elif int(splited_date[1]) >= 7 and int(splited_date[1]) <= 12 and int(splited_date[2]) > 31:
-                # day/month/year2d
-                year = splited_date[2]
-                month = str(int(splited_date[1]))
-                day = str(int(splited_date[0]))
-                date_type = self.define_date_type(year)
-                sentence = sentence.replace(match, self.define_template_type(date_type, year, month, day))
-            elif int(splited_date[1]) <= 6 and int(splited_date[1]) <= 6 and int(splited_date[1]) <= 12 and int(
-                    splited_date[2]) > 31:
-                # day/month/year2d
-                year = splited_date[2]
-                month = str(int(splited_date[1]))
-                day = str(int(splited_date[0]))
-                date_type = self.define_date_type(year)
-                sentence = sentence.replace(match, self.define_template_type(date_type, year, month, day))
-            elif 4 == splited_date_len[2] and int(splited_date[1]) <= 12:
-                # day/month/year4d
-                year = splited_date[2]
-                month = str(int(splited_date[1]))
-                day = splited_date[0]
-                date_type = self.define_date_type(year)
-                sentence = sentence.replace(match, self.define_template_type(date_type, year, month, day))
-
+        sentence = self.date_pattern.sub(self.date_match_to_text, sentence)
         return self.number_correction(sentence)
 
+    def date_match_to_text(self, match):
+        date = self.split_date(*(match.group(part).translate(self.english_digits_table)
+                                 for part in ("first", "second", "third")))
+        if date is None:
+            return match.group()
+        year, month, day = date
+        date_type = self.define_date_type(year)
+        if self.template_selector.deterministic:
+            return self.memoized_template_type(date_type, year, month, day)
+        return self.define_template_type(date_type, year, month, day)
+
+    def split_date(self, first, second, third):
+        """
+        Returns the year, month and day of a date written year first or day
+        first, or None when the numbers do not make a date.
+        """
+        if int(first) < 1 or int(second) < 1 or int(third) < 1 or int(second) > 12:
+            return None
+        month = str(int(second))
+        if len(first) == 4:
+            # year4d/month/day
+            return first, month, third
+        if int(second) >= 7 and int(first) > 31:
+            # year2d/month/day
+            return first, month, third
+        if int(second) <= 6 and int(first) >= 31:
+            # year2d/month/day
+            return first, month, str(int(third))
+        if int(third) > 31:
+            # day/month/year2d
+            return third, month, str(int(first))
+        if len(third) == 4:
+            # day/month/year4d
+            return third, month, first
+        return None
+
     def convert_miladi_month(self, sentence):
         for miladi_month_name in self.miladi_month_names:
             sentence = re.sub('({})'.format('|'.join(map(re.escape, miladi_month_name.keys()))),
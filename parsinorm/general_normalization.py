@@ -1,8 +1,8 @@
 import re
-from num2fawords import words
+from .number_words import words
+from .character_filter import Character_filter
 from decimal import Decimal
 import copy
-from itertools import groupby
 from string import punctuation
 
 
@@ -640,6 +640,9 @@ class General_normalization:
                                      "P", "q", "Q", "r", "R", "s", "S", "t", "T", "u", "U", "v", "V", "w", "W", "x",
                                      "X", "y", "Y", "z", "Z", "\u200c", "\u200e", "\\s", "،", ".", "(", ")", "!",
                                      "؟", ":", " ", ""]
+        # entries of other lengths, such as "\\s", never matched a character
+        self.characters_to_remain_filter = Character_filter.from_characters(
+            character for character in self.characters_to_remain if len(character) == 1)
 
         self.special_persian_characters_h = {'ۀ': 'ه', 'ة': 'ه'}
         self.special_persian_characters_hamze = {'أ': 'ا', 'إ': 'ا', 'ؤ': 'و'}
@@ -649,51 +652,99 @@ class General_normalization:
             self.special_persian_characters_hamze
         ]
 
+        # translation tables and patterns are built once here instead of on every call
+        self.persian_alphabet_table = self.compose_replaces(self.persian_alphabet_replaces)
+        self.english_alphabet_table = self.compose_replaces(self.english_alphabet_replaces)
+        self.arabic_table = self.compose_replaces(self.arabic_replaces)
+        self.number_table = self.compose_replaces(self.number_replaces)
+        self.punctuation_table = self.compose_replaces(self.punctuation_replaces)
+        self.special_table = self.compose_replaces(self.special_replaces)
+        self.special_persian_characters_table = self.compose_replaces(self.special_persian_characters_replaces)
+        self.fused_tables = {}
+        self.math_table = str.maketrans(self.math_replaces)
+        self.html_pattern = re.compile('({})'.format('|'.join(map(re.escape, self.html_replaces.keys()))))
+        self.semi_space_pattern = re.compile('({})'.format('|'.join(map(re.escape, self.semi_space.keys()))))
+        self.repeated_punctuation = (set(punctuation) - set('.')) | {"؟", "،"}
+        # a run of one repeated punctuation mark, kept once
+        self.repeated_punctuation_pattern = re.compile(
+            "([{}])\\1+".format("".join(map(re.escape, sorted(self.repeated_punctuation)))))
+        # a thousands or decimal separator between two digits
+        self.digit_separator_pattern = re.compile(r'(?<=[۰-۹])[٬٫](?=[۰-۹])')
+
+    @staticmethod
+    def compose_replaces(replaces):
+        """
+        Composes a list of single character replacement dicts into one
+        translation table. Translating with it gives the same result as
+        translating with every dict in turn, in list order.
+        """
+        tables = [str.maketrans(replace) for replace in replaces]
+        composed = {}
+        for replace in replaces:
+            for character in replace:
+                if ord(character) in composed:
+                    continue
+                replaced = character
+                for table in tables:
+                    replaced = replaced.translate(table)
+                composed[ord(character)] = replaced
+        return composed
+
+    def fused_table(self, alphabet=False, english=False, arabic=False, punctuation=False, specials=False,
+                    number=False):
+        """
+        Returns one translation table equivalent to running the enabled
+        corrections in this order: alphabet, english, arabic, punctuation,
+        specials and number. Tables are built once per combination.
+        """
+        key = (alphabet, english, arabic, punctuation, specials, number)
+        table = self.fused_tables.get(key)
+        if table is None:
+            replaces = []
+            if alphabet:
+                replaces.extend(self.persian_alphabet_replaces)
+            if english:
+                replaces.extend(self.english_alphabet_replaces)
+            if arabic:
+                replaces.extend(self.arabic_replaces)
+            if punctuation:
+                replaces.extend(self.punctuation_replaces)
+            if specials:
+                replaces.extend(self.special_replaces)
+            if number:
+                replaces.extend(self.number_replaces)
+            table = self.compose_replaces(replaces)
+            self.fused_tables[key] = table
+        return table
+
     def alphabet_correction(self, sentence):
-        for persian_alphabet_replace in self.persian_alphabet_replaces:
-            sentence = sentence.translate(str.maketrans(persian_alphabet_replace))
-        return sentence
+        return sentence.translate(self.persian_alphabet_table)
 
     def special_alphabet_correction(self, sentence):
-        for special_persian_character in self.special_persian_characters_replaces:
-            sentence = sentence.translate(str.maketrans(special_persian_character))
-        return sentence
+        return sentence.translate(self.special_persian_characters_table)
 
     def english_correction(self, sentence):
-        for english_alphabet_replace in self.english_alphabet_replaces:
-            sentence = sentence.translate(str.maketrans(english_alphabet_replace))
-        return sentence
+        return sentence.translate(self.english_alphabet_table)
 
     def arabic_correction(self, sentence):
-        for arabic_replace in self.arabic_replaces:
-            sentence = sentence.translate(str.maketrans(arabic_replace))
-        return sentence
+        return sentence.translate(self.arabic_table)
 
     def number_correction(self, sentence):
-        for number_replace in self.number_replaces:
-            sentence = sentence.translate(str.maketrans(number_replace))
-        return sentence
+        return sentence.translate(self.number_table)
 
     def punctuation_correction(self, sentence):
-        for punctuation_replace in self.punctuation_replaces:
-            sentence = sentence.translate(str.maketrans(punctuation_replace))
-        return sentence
+        return sentence.translate(self.punctuation_table)
 
     def math_correction(self, sentence):
-        sentence = sentence.translate(str.maketrans(self.math_replaces))
+        sentence = sentence.translate(self.math_table)
         return sentence
 
     def html_correction(self, sentence):
-        sentence = re.sub('({})'.format('|'.join(map(re.escape, self.html_replaces.keys()))),
-                          lambda m: self.html_replaces[m.group()],
-                          sentence)
+        sentence = self.html_pattern.sub(lambda m: self.html_replaces[m.group()], sentence)
         return sentence
 
     def specials_chars(self, sentence):
-        for special_replace in self.special_replaces:
-            sentence = re.sub('({})'.format('|'.join(map(re.escape, special_replace.keys()))),
-                              lambda m: special_replace[m.group()], sentence)
-        return sentence
+        return sentence.translate(self.special_table)
 
     def remove_emojis(self, sentence):
         return re.sub(self.emoj, '', sentence)
@@ -719,17 +770,11 @@ class General_normalization:
 
     def remove_comma_between_numbers(self, sentence):
         sentence = self.number_correction(sentence=sentence)
-        floating_points_with_comma1 = re.findall(r'[۰-۹]+٬[۰-۹]+', sentence)
-        if floating_points_with_comma1:
-            for floating_point_with_comma1 in floating_points_with_comma1:
-                floating_point_with_comma_new1 = floating_point_with_comma1.replace("٬", "")
-                sentence = sentence.replace(str(floating_point_with_comma1), floating_point_with_comma_new1)
-        floating_points_with_comma2 = re.findall(r'[۰-۹]+٫[۰-۹]+', sentence)
-        if floating_points_with_comma2:
-            for floating_point_with_comma2 in floating_points_with_comma2:
-                floating_point_with_comma_new2 = floating_point_with_comma2.replace("٫", "")
-                sentence = sentence.replace(str(floating_point_with_comma2), floating_point_with_comma_new2)
-        return sentence
+        return self.remove_comma_between_digits(sentence)
+
+    def remove_comma_between_digits(self, sentence):
+        # expects digits already converted by number_correction
+        return self.digit_separator_pattern.sub("", sentence)
 
     def space_between_punctuations_and_text(self, sentence):
         sentence = re.sub('([.,!?()])', r' \1 ', sentence)
@@ -737,24 +782,10 @@ class General_normalization:
         return sentence
 
     def remove_repeated_punctuation(self, sentence):
-        punc = set(punctuation) - set('.')
-        punc.add("؟")
-        punc.add("،")
-        newtext = []
-        for k, g in groupby(sentence):
-            if k in punc:
-                newtext.append(k)
-            else:
-                newtext.extend(g)
-        return ''.join(newtext)
+        return self.repeated_punctuation_pattern.sub(r"\1", sentence)
 
     def remove_not_desired_chars(self, sentence):
-        # print(self.characters_to_remain)
-        for character in sentence:
-            if character not in self.characters_to_remain:
-                sentence = sentence.replace(character, " ")
-        return sentence
-        return ''.join(re.findall(self.characters_to_remain, sentence))
+        return self.characters_to_remain_filter(sentence)
 
     def twitter_normalization(self, sentence):
         sentence = re.sub(r'#\w+ ?', '', sentence)
@@ -763,9 +794,7 @@ class General_normalization:
         return sentence
 
     def semi_space_correction(self, sentence):
-        sentence = re.sub('({})'.format('|'.join(map(re.escape, self.semi_space.keys()))),
-                          lambda m: self.semi_space[m.group()],
-                          sentence)
+        sentence = self.semi_space_pattern.sub(lambda m: self.semi_space[m.group()], sentence)
         return sentence
 
     def space_correction(self, sentence):
@@ -1,7 +1,21 @@
-from urlextract import URLExtract
 import re
 
-extractor = URLExtract()
+# URLExtract loads its TLD list when constructed, so it is built on first use
+_extractor = None
+
+
+def get_extractor():
+    global _extractor
+    if _extractor is None:
+        from urlextract import URLExtract
+        _extractor = URLExtract()
+    return _extractor
+
+
+def __getattr__(name):
+    if name == "extractor":
+        return get_extractor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Mail_url_cleaner:
@@ -25,7 +39,7 @@ class Mail_url_cleaner:
                 url = url.split("/")[0]
                 sentence = sentence.replace(str(old_url), str(url))
 
-        urls = extractor.find_urls(sentence)
+        urls = get_extractor().find_urls(sentence)
         if urls:
             for url in urls:
                 old_url = url
@@ -0,0 +1,170 @@
+"""
+Table driven Persian number verbalizer.
+
+Numbers are read three digits at a time from a table of the words for 0-999
+built at import, and integers and decimals are read from their digits
+without going through float, so long numbers keep every digit.
+
+Two readings are provided:
+
+* `words` and `ordinal_words` are drop-in replacements for the functions of
+  the same name in num2fawords ("یکصد", "یک هزار"), used by the parsinorm
+  classes.
+* `cardinal_words` reads numbers like num2words' Persian converter ("صد",
+  "هزار", "نیم"), used by ParsNorm's number conversion.
+"""
+import functools
+
+ONES = ['', 'یک', 'دو', 'سه', 'چهار', 'پنج', 'شش', 'هفت', 'هشت', 'نه']
+TENS = ['', '', 'بیست', 'سی', 'چهل', 'پنجاه', 'شصت', 'هفتاد', 'هشتاد', 'نود']
+TEN_TO_TWENTY = ['ده', 'یازده', 'دوازده', 'سیزده', 'چهارده', 'پانزده', 'شانزده', 'هفده', 'هجده', 'نوزده']
+HUNDREDS = ['', 'یکصد', 'دویست', 'سیصد', 'چهارصد', 'پانصد', 'ششصد', 'هفتصد', 'هشتصد', 'نهصد']
+DIGITS = ['صفر'] + ONES[1:]
+SEPARATOR = ' و '
+
+# scale words of num2fawords and of num2words; the latter stops at 10^15 and
+# is continued here with the same short scale names
+CLASSES = ['', ' هزار', ' میلیون', ' میلیارد', ' بیلیون', ' بیلیارد', ' تریلیون', ' ترلیارد',
+           ' کوآدریلیون', ' کادریلیارد', ' کوینتیلیون', ' کوانتینیارد']
+CARDINAL_CLASSES = ['', ' هزار', ' میلیون', ' میلیارد', ' تریلیون', ' تریلیارد',
+                    ' کوآدریلیون', ' کوآدریلیارد', ' کوینتیلیون', ' کوینتیلیارد']
+
+# names of the decimal places, indexed by the number of digits after the point
+DECIMAL_PLACES = ['', ' دهم', ' صدم'] + [place for name in CLASSES[1:]
+                                         for place in (name + 'م', ' ده' + name + 'م', ' صد' + name + 'م')]
+CARDINAL_DECIMAL_PLACES = [(small + ' ' + big).strip()
+                           for big in ('', 'هزارم', 'میلیونیم', 'میلیاردیم', 'تریلیونیم', 'تریلیاردیم',
+                                       'کوآدریلیونیم', 'کوآدریلیاردیم', 'کوینتیلیونیم', 'کوینتیلیاردیم')
+                           for small in ('', 'دهم', 'صدم')]
+
+_NORMALIZATION_TABLE = str.maketrans('٫', '.', '_٬,+')
+
+
+def _three_digit_table(hundreds):
+    table = []
+    for number in range(1000):
+        h, t, o = number // 100, number % 100 // 10, number % 10
+        if t == 1:
+            parts = (hundreds[h], TEN_TO_TWENTY[o])
+        else:
+            parts = (hundreds[h], TENS[t], ONES[o])
+        table.append(SEPARATOR.join(part for part in parts if part))
+    return table
+
+
+THREE_DIGIT_WORDS = _three_digit_table(HUNDREDS)
+CARDINAL_THREE_DIGIT_WORDS = _three_digit_table(['', 'صد'] + HUNDREDS[2:])
+
+
+def _natural_words(number, three_digit_words, classes, one_thousand='یک هزار'):
+    """Words of the positive int `number`, highest group first."""
+    if number < 1000:
+        return three_digit_words[number]
+    groups = []
+    level = 0
+    while number:
+        number, group = divmod(number, 1000)
+        if group == 1 and level == 1:
+            groups.append(one_thousand)
+        elif group:
+            groups.append(three_digit_words[group] + classes[level])
+        level += 1
+    return SEPARATOR.join(reversed(groups))
+
+
+def _spell_digits(digits):
+    return ' '.join(DIGITS[int(digit)] for digit in digits)
+
+
+def _fawords_natural(digits):
+    # num2fawords reads the literal "0" as zero but any other all-zero string,
+    # such as "00" or "۰", as the empty string; callers rely on it
+    if digits == '0':
+        return 'صفر'
+    if len(digits) > len(CLASSES) * 3:
+        raise ValueError('out of range')
+    return _natural_words(int(digits), THREE_DIGIT_WORDS, CLASSES)
+
+
+@functools.lru_cache(maxsize=4096)
+def words(number, decimal_separator=SEPARATOR):
+    """
+    Returns the words of `number`, an int or a numeric string that may use
+    Persian digits, exactly as ``num2fawords.words`` does. Fractions,
+    exponents and other types are handed to num2fawords.
+    """
+    if isinstance(number, int) and not isinstance(number, bool):
+        if number == 0:
+            return 'صفر'
+        if number < 0:
+            return 'منفی ' + _fawords_natural(str(number)[1:])
+        return _fawords_natural(str(number))
+    if not isinstance(number, str) or '/' in number or 'e' in number.lower():
+        from num2fawords import words as fawords
+        return fawords(number, decimal_separator=decimal_separator)
+
+    number = number.strip().translate(_NORMALIZATION_TABLE)
+    sign = ''
+    if number[0] == '-':
+        sign = 'منفی '
+        number = number[1:]
+    before_point, _, after_point = number.partition('.')
+    if not after_point:
+        return sign + _fawords_natural(before_point)
+    if before_point == '0':
+        if after_point == '0':
+            return sign + 'صفر'
+        return sign + _fawords_natural(after_point) + DECIMAL_PLACES[len(after_point)]
+    if after_point != '0':
+        return (sign + _fawords_natural(before_point) + decimal_separator
+                + _fawords_natural(after_point) + DECIMAL_PLACES[len(after_point)])
+    return sign + _fawords_natural(before_point)
+
+
+@functools.lru_cache(maxsize=4096)
+def ordinal_words(number):
+    """Returns the ordinal words of `number`, like ``num2fawords.ordinal_words``."""
+    text = words(int(number))
+    if text[-2:] == 'سه':
+        return text[:-2] + 'سوم'
+    return text + 'م'
+
+
+CARDINAL_LIMIT = 1000 ** len(CARDINAL_CLASSES)
+
+
+def _cardinal_natural(number):
+    if number >= CARDINAL_LIMIT:
+        return _spell_digits(str(number))
+    return _natural_words(number, CARDINAL_THREE_DIGIT_WORDS, CARDINAL_CLASSES, one_thousand='هزار')
+
+
+@functools.lru_cache(maxsize=4096)
+def cardinal_words(number):
+    """
+    Returns the words of the non-negative `number`, an int or a decimal
+    string that may use Persian digits, the way ``num2words(..., lang='fa')``
+    reads it: "صد" and "هزار" without "یک", and "نیم" for one half.
+
+    Unlike num2words the digits are never converted to float, so long
+    integers and decimals are read exactly.
+    """
+    if isinstance(number, int):
+        integer, fraction = number, ''
+    else:
+        before_point, point, fraction = number.partition('.')
+        integer = int(before_point or '0')
+        if point:
+            fraction = fraction.rstrip('0۰')
+    if not fraction:
+        return _cardinal_natural(integer) if integer else 'صفر'
+
+    if fraction in ('5', '۵'):
+        fraction_text = 'نیم'
+    elif len(fraction) < len(CARDINAL_DECIMAL_PLACES):
+        fraction_text = _cardinal_natural(int(fraction)) + ' ' + CARDINAL_DECIMAL_PLACES[len(fraction)]
+    else:
+        fraction_text = 'ممیز ' + _spell_digits(fraction)
+    if not integer:
+        return fraction_text
+    return _cardinal_natural(integer) + SEPARATOR + fraction_text
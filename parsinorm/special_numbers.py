@@ -1,18 +1,26 @@
 import re
-from num2fawords import words
-import copy
+from .number_words import words
 from itertools import groupby
 from string import punctuation
 from persian_tools.bank import card_number
 from persian_tools.bank import sheba
 from persian_tools import national_id
-import random
 from .general_normalization import General_normalization
+from .template_selector import Template_selector
 
 
 class Special_numbers:
-    def __init__(self):
+    # the numbers of a sentence in one scan: a range of integers, a decimal,
+    # or an integer of any length
+    number_pattern = r'(?P<range>(?P<start>[۰-۹]+)(?P<separator>\s?-\s?)(?P<end>[۰-۹]+))|(?P<decimal>[۰-۹]+\.[۰-۹]+)|(?P<integer>[۰-۹]+)'
+
+    def __init__(self, template_selector=None):
+        self.template_selector = template_selector or Template_selector()
         self.general_normalization = General_normalization()
+        self.number_scanner = re.compile(self.number_pattern)
+        # once a sentence has a range, every hyphen in it is read out
+        self.number_hyphen_scanner = re.compile(self.number_pattern + r'|(?P<hyphen>-)')
+        self.range_pattern = re.compile(r'[۰-۹]+\s?-\s?[۰-۹]+')
 
     def convert_number_to_letter(self, number):
         if len(number) > 15:
@@ -28,42 +36,38 @@ class Special_numbers:
 
     def convert_numbers_to_text(self, sentence):
         sentence = self.general_normalization.number_correction(sentence=sentence)
-        between_nums = re.findall(r'[۰-۹]+\s?-\s?[۰-۹]+', sentence)
-        if between_nums:
-            for between_num in between_nums:
-                between_num_new = copy.copy(between_num)
-                between_number_numbers = between_num.replace("-", " الی ").split(" الی ")
-                for number in between_number_numbers:
-                    between_num_new = between_num_new.replace(str(number), self.convert_number_to_letter(number))
-            sentence = sentence.replace(str(between_num), between_num_new)
-            sentence = sentence.replace("-", "خط تیره")
-        floating_points = re.findall(r'[۰-۹]+\.[۰-۹]+', sentence)
-        for floating_point in floating_points:
-            floating_point_new = ""
-            natural_number = floating_point.split(".")[0]
-            exp_number = floating_point.split(".")[1]
-            if len(exp_number) > 4 or len(natural_number) > 10:
-                exp_number = exp_number[:4]
-                natural_number = natural_number[:10]
-                floating_point_new = f"{natural_number}.{exp_number}"
-                floating_point_new = words(str(floating_point_new), decimal_separator=' ممیز ')
-            else:
-                floating_point_new = words(str(floating_point), decimal_separator=' ممیز ')
-            zero = re.findall(r'^[0|۰]*[0|۰]$', exp_number)
-            if zero:
-                sentence = sentence.replace(str(floating_point), self.convert_number_to_letter(natural_number))
+        return self.number_scanner_for(sentence).sub(self.number_to_text, sentence)
 
-            # if exp_number == 0 or exp_number
-            sentence = sentence.replace(str(floating_point), floating_point_new)
-        numbers = re.findall(r'[۰-۹]+', sentence)
-        for index in range(len(numbers)):
-            numbers[index] = int(numbers[index])
-        numbers.sort(reverse=True)
-        for index in range(len(numbers)):
-            numbers[index] = self.general_normalization.number_correction(sentence=str(numbers[index]))
-        for number in numbers:
-            sentence = sentence.replace(str(number), self.convert_number_to_letter(number))
-        return sentence
+    def number_scanner_for(self, sentence):
+        """Returns the scanner for a sentence whose digits are already corrected."""
+        if "-" in sentence and self.range_pattern.search(sentence):
+            return self.number_hyphen_scanner
+        return self.number_scanner
+
+    def number_to_text(self, match):
+        kind = match.lastgroup
+        if kind == "integer":
+            return self.integer_to_text(match.group())
+        if kind == "decimal":
+            return self.decimal_to_text(match.group())
+        if kind == "range":
+            return self.integer_to_text(match.group("start")) + match.group("separator").replace("-", "خط تیره") + \
+                   self.integer_to_text(match.group("end"))
+        return "خط تیره"
+
+    def integer_to_text(self, number):
+        # leading zeros are not read
+        return self.convert_number_to_letter(number.lstrip("۰") or "۰")
+
+    def decimal_to_text(self, floating_point):
+        natural_number, exp_number = floating_point.split(".")
+        if len(exp_number) > 4 or len(natural_number) > 10:
+            exp_number = exp_number[:4]
+            natural_number = natural_number[:10]
+            floating_point = f"{natural_number}.{exp_number}"
+        if not exp_number.strip("۰"):
+            return self.convert_number_to_letter(natural_number)
+        return words(floating_point, decimal_separator=' ممیز ')
 
     def special_number_to_text(self, number, type):
         converted_to_text = " "
@@ -85,7 +89,7 @@ class Special_numbers:
                 steps_template[0].append(3)
         idx = 0
         step_round = 0
-        steps_template_number = random.randint(0, len(steps_template) - 1)
+        steps_template_number = self.template_selector.choose(len(steps_template), number)
         steps = steps_template[steps_template_number]
         while idx < len(number):
             converted_to_text += " "
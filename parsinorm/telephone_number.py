@@ -1,76 +1,45 @@
 import re
-import random
-from num2fawords import words, HUNDREDS, ordinal_words
+from .number_words import words, HUNDREDS, ordinal_words
 from .general_normalization import General_normalization
+from .template_selector import Template_selector
 
 
 class Telephone_number:
-    def __init__(self):
-        self.general_normalization = General_normalization()
+    # the forms a phone number is recognised in: after a cue word, or by its
+    # prefix. Where two forms start at the same place the longer comes first.
+    # A number after a cue may keep its Tehran area code apart, "۰۲۱-..."
+    phone_patterns = [
+        r'تلفن: {number}',
+        r'تلفن \+[۰-۹]+',
+        r'تلفن {number}\s?-\s?[۰-۹]+',
+        r'تلفن {number}',
+        r' و {number} تلفن های  {number}',
+        r'تلفن های {number} و {number}',
+        r'تلفنهای {number} و {number}',
+        r'فکس {number}',
+        r'فاکس {number}',
+        r'شماره تماس: {number}',
+        r'سامانه پیامکی: {number}',
+        r' شماره: {number}',
+        r' شماره {number}',
+        r'۰۹[۰-۹]{{9}}',
+        r'۰۲۱-?[۰-۹]+',
+    ]
 
+    def __init__(self, template_selector=None):
+        self.template_selector = template_selector or Template_selector()
+        self.general_normalization = General_normalization()
+        self.phone_pattern = re.compile("|".join(self.phone_patterns).format(number=r'(?:۰۲۱-)?[۰-۹]+'))
+        self.phone_digits_pattern = re.compile(r'\+?[۰-۹]+')
 
     def find_phones_replace(self, sentence):
         sentence = self.general_normalization.number_correction(sentence=sentence)
-        telephones = []
-        numbers_with_telephone1 = re.findall(r'تلفن: [۰-۹]+', sentence)
-        if numbers_with_telephone1:
-            telephones.extend(numbers_with_telephone1)
-        numbers_with_telephone2 = re.findall(r'تلفن [۰-۹]+', sentence)
-        if numbers_with_telephone2:
-            telephones.extend(numbers_with_telephone2)
-        numbers_with_telephone3 = re.findall(r' و [۰-۹]+ تلفن های  [۰-۹]+', sentence)
-        if numbers_with_telephone3:
-            telephones.extend(numbers_with_telephone3)
-        numbers_with_telephone4 = re.findall(r'تلفن های [۰-۹]+ و [۰-۹]+', sentence)
-        if numbers_with_telephone4:
-            telephones.extend(numbers_with_telephone4)
-        numbers_with_telephone5 = re.findall(r'تلفنهای [۰-۹]+ و [۰-۹]+', sentence)
-        if numbers_with_telephone5:
-            telephones.extend(numbers_with_telephone5)
-        numbers_with_telephone6 = re.findall(r'فکس [۰-۹]+', sentence)
-        if numbers_with_telephone6:
-            telephones.extend(numbers_with_telephone6)
-        numbers_with_telephone7 = re.findall(r'فاکس [۰-۹]+', sentence)
-        if numbers_with_telephone7:
-            telephones.extend(numbers_with_telephone7)
-        numbers_with_telephone8 = re.findall(r'۰۹[۰-۹]{9}', sentence)
-        if numbers_with_telephone8:
-            telephones.extend(numbers_with_telephone8)
-        numbers_with_telephone9 = re.findall(r'۰۲۱[۰-۹]{8}', sentence)
-        if numbers_with_telephone9:
-            telephones.extend(numbers_with_telephone9)
-        numbers_with_telephone10 = re.findall(r'۰۲۱-[۰-۹]{8}', sentence)
-        if numbers_with_telephone10:
-            telephones.extend(numbers_with_telephone10)
-        numbers_with_telephone11 = re.findall(r'۰۲۱-[۰-۹]+', sentence)
-        if numbers_with_telephone11:
-            telephones.extend(numbers_with_telephone11)
-        numbers_with_telephone12 = re.findall(r'۰۲۱[۰-۹]+', sentence)
-        if numbers_with_telephone12:
-            telephones.extend(numbers_with_telephone12)
-        numbers_with_telephone13 = re.findall(r'تلفن \+[۰-۹]+', sentence)
-        if numbers_with_telephone13:
-            telephones.extend(numbers_with_telephone13)
-        numbers_with_telephone14 = re.findall(r'تلفن [۰-۹]+\s?-\s?[۰-۹]+', sentence)
-        if numbers_with_telephone14:
-            telephones.extend(numbers_with_telephone14)
-        numbers_with_telephone15 = re.findall(r'شماره تماس: [۰-۹]+', sentence)
-        if numbers_with_telephone15:
-            telephones.extend(numbers_with_telephone15)
-        numbers_with_telephone16 = re.findall(r'سامانه پیامکی: [۰-۹]+', sentence)
-        if numbers_with_telephone16:
-            telephones.extend(numbers_with_telephone16)
-        numbers_with_telephone17 = re.findall(r' شماره: [۰-۹]+', sentence)
-        if numbers_with_telephone17:
-            telephones.extend(numbers_with_telephone17)
-        numbers_with_telephone18 = re.findall(r' شماره [۰-۹]+', sentence)
-        if numbers_with_telephone18:
-            telephones.extend(numbers_with_telephone18)
-        for telephone in telephones:
-            tels = re.findall(r'\+?[۰-۹]+', telephone)
-            for tel in tels:
-                sentence = sentence.replace(tel, self.number_with_varaible_length(str(tel)))
-        return sentence
+        return self.phone_pattern.sub(self.phone_to_text, sentence)
+
+    def phone_to_text(self, match):
+        # only the numbers of the matched phone are read, the cue is kept
+        return self.phone_digits_pattern.sub(lambda digits: self.number_with_varaible_length(digits.group()),
+                                             match.group())
 
     def convert_number_to_letter(self, number):
         text = words(number)
@@ -85,6 +54,8 @@ class Telephone_number:
             converted_to_text += " دو صفر "
             converted_to_text += self.convert_number_to_letter(number[1:3])
             number = number[3:]
+            if not number:
+                return converted_to_text
         if len(number) == 1:
             steps_template = [[1]]
         elif len(number) == 2:
@@ -148,7 +119,7 @@ class Telephone_number:
             length = int((len(number) - 3) / 2)
             steps_template = [[2 for index in range(length)]]
             steps_template[0].append(3)
-        steps_template_number = random.randint(0, len(steps_template) - 1)
+        steps_template_number = self.template_selector.choose(len(steps_template), number)
         steps = steps_template[steps_template_number]
         while idx < len(number):
             converted_to_text += " "
@@ -0,0 +1,45 @@
+import random
+import zlib
+
+
+class Template_selector:
+    """
+    Chooses which of several equivalent templates verbalizes a date, time or
+    number.
+
+    policy
+        "random": the global `random` module, so outputs vary between runs.
+        "fixed": always the first template.
+        "seed": a `random.Random(seed)` owned by the selector; reproducible
+                for the same sequence of calls in one process.
+        "hash": derived from `seed` and the value being verbalized, so the
+                same value always reads the same, in any order and in any
+                process.
+    """
+    POLICIES = ("random", "fixed", "seed", "hash")
+
+    def __init__(self, policy="random", seed=0):
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(self.POLICIES)}, not {policy!r}")
+        self.policy = policy
+        self.seed = seed
+        self.rng = random.Random(seed) if policy == "seed" else None
+        self.salt = f"{seed}\x00".encode("utf-8")
+
+    @property
+    def deterministic(self):
+        """True when a value always gets the same template, so its reading can be memoized."""
+        return self.policy in ("fixed", "hash")
+
+    def choose(self, count, key):
+        """Returns the index, below `count`, of the template for the value `key`."""
+        if self.policy == "random":
+            # drawn even for a single template, as before, so that seeding
+            # the random module reproduces earlier outputs
+            return random.randint(0, count - 1)
+        if count <= 1 or self.policy == "fixed":
+            return 0
+        if self.policy == "seed":
+            return self.rng.randrange(count)
+        # crc32 rather than hash(), which is salted per process for str
+        return zlib.crc32(self.salt + str(key).encode("utf-8")) % count
@@ -1,23 +1,49 @@
+import io
 import re
 import os
-from hazm import POSTagger
 import string
+import threading
+
+POS_TAGGER_MODEL = os.path.join(os.path.dirname(os.path.realpath(__file__)), "resources", "postagger.model")
+
+_pos_tagger = None
+_pos_tagger_lock = threading.Lock()
+
+
+def pos_tagger():
+    """
+    Returns the hazm POS tagger of `POS_TAGGER_MODEL`, loaded on first use
+    and shared by every `Tokenizer` of the process.
+    """
+    global _pos_tagger
+    if _pos_tagger is None:
+        with _pos_tagger_lock:
+            if _pos_tagger is None:
+                from hazm import POSTagger
+                _pos_tagger = POSTagger(model=POS_TAGGER_MODEL)
+    return _pos_tagger
 
 
 class Tokenizer:
     def __init__(self):
         self.dir_path = os.path.dirname(os.path.realpath(__file__)) + "/"
+        self._tagger = None
         self.english_characters = list(string.ascii_lowercase) + list(string.ascii_uppercase)
         self.persian_pattern_abbreviation = r"\b[آ-ی](?=([.]))(?:\1[آ-ی])*\b.?"
         self.english_pattern_abbreviation = r"\b[A-Z](?=([.]))(?:\1[A-Z])*\b.?"
+        self.number_pattern = re.compile(r"[-+]?\d*\.\d+|\d+")
+        # what ends a sentence: punctuation with the newlines after it, a colon
+        # or semicolon at the end of a line, or newlines
+        self.sentence_boundary_pattern = re.compile(r"[!\.\?؟]+\n*|[:;؛]\n|\n+")
         self.punctuation_pattern = re.compile(r'([؟!\?]+|\d[\d\.:\/\\]+\d|\d+|[:\.،؛»\]\)\}"«\[\(\{])')
         self.mail_pattern = re.compile(r"[A-Za-z0-9\.\-+_]+@[A-Za-z0-9\.\-+_]+\.[a-z]+")
         self.url_pattern = re.compile(
-            r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]+|\(([^\s()<>]+|(\([^\s()<>]+\)))*\))+(?:\(([^\s()<>]+|(\([^\s()<>]+\)))*\)|[^\s`!()\[\]{};:'\".,<>?«»“”‘’]))")
+            # one character per repetition: the nested `+` of the usual form of
+            # this pattern backtracks exponentially on long unmatched runs
+            r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]|\((?:[^\s()<>]|\([^\s()<>]+\))*\))+(?:\((?:[^\s()<>]|\([^\s()<>]+\))*\)|[^\s`!()\[\]{};:'\".,<>?«»“”‘’]))")
         self.hashtag_pattern = re.compile(r"#(\w+)")
         self.mention_pattern = re.compile(r"\B@(?!(?:[a-z0-9.]*_){2})(?!(?:[a-z0-9_]*\.){2})[._a-z0-9]{3,24}\b")
-        self.emoji_pattern = re.compile(
-            "(["
+        self.emoji_characters = (
             "\U00002500-\U00002BEF"  # chinese char
             "\U0001F1E0-\U0001F1FF"  # flags (iOS)
             "\U0001F300-\U0001F5FF"  # symbols & pictographs
@@ -42,8 +68,16 @@ class Tokenizer:
             "\u231a"
             "\ufe0f"  # dingbats
             "\u3030"
-            "])"
         )
+        self.emoji_pattern = re.compile(f"([{self.emoji_characters}])")
+        # the kinds of token `word_tokenize` splits the text between emails,
+        # urls, hashtags and mentions into: punctuation and numbers, emojis,
+        # and runs of English or of other characters
+        self.token_pattern = re.compile(
+            r'(?P<punctuation>[؟!\?]+|\d[\d\.:\/\\]+\d|\d+|[:\.،؛»\]\)\}"«\[\(\{])'
+            "|[" + self.emoji_characters + "]"
+            "|[A-Za-z]+"
+            r'|[^\sA-Za-z؟!\?\d:\.،؛»\]\)\}"«\[\(\{' + self.emoji_characters + "]+")
 
     def replace_other(self, sentence):
         others = re.findall(r'و\.\.\.', sentence)
@@ -74,95 +108,153 @@ class Tokenizer:
                 sentences[dot_index - 1] = sentences[dot_index - 1] + sentences[dot_index]
                 sentences.pop(dot_index)
 
+    def mask_sentence(self, sentence):
+        """
+        Returns `sentence` with its abbreviations, numbers, emails and urls,
+        which never end a sentence, masked by as many letters. Each kind is
+        searched for with the kinds before it already masked.
+        """
+        masked = sentence
+        for pattern in (self.persian_pattern_abbreviation, self.english_pattern_abbreviation, self.number_pattern,
+                        self.mail_pattern, self.url_pattern):
+            pieces, position = [], 0
+            for match in re.finditer(pattern, masked):
+                pieces.append(masked[position:match.start()])
+                pieces.append("X" * (match.end() - match.start()))
+                position = match.end()
+            if pieces:
+                pieces.append(masked[position:])
+                masked = "".join(pieces)
+        return masked
+
+    def mark_sentences(self, sentence):
+        """
+        Returns `sentence` with every sentence end marked by a tab pair and
+        its punctuation set off by a space, in one pass.
+        """
+        pieces, position = [], 0
+        for match in self.sentence_boundary_pattern.finditer(self.mask_sentence(sentence)):
+            pieces.append(sentence[position:match.start()])
+            pieces.append(self.add_tab(match))
+            position = match.end()
+        pieces.append(sentence[position:])
+        return "".join(pieces)
+
+    def _join_dots(self, pieces):
+        # `remove_space_in_dot` followed by dropping blank pieces, one piece
+        # at a time: the first lone " ." joins the piece before it, or, when
+        # it comes first, the last piece (the second if there are only two)
+        pieces = iter(pieces)
+        previous = next(pieces, None)
+        if previous is None:
+            return
+        if previous == ' .':
+            count, held = 1, None
+            for piece in pieces:
+                count += 1
+                if held is not None and len(held.strip()) > 0:
+                    yield held
+                held = piece
+            if held is not None:
+                last = held + '.' if count == 2 else held + ' .'
+                if len(last.strip()) > 0:
+                    yield last
+            return
+        joined = False
+        for piece in pieces:
+            if not joined and piece == ' .':
+                previous += piece
+                joined = True
+                continue
+            if len(previous.strip()) > 0:
+                yield previous
+            previous = piece
+        if len(previous.strip()) > 0:
+            yield previous
+
+    def _pieces(self, chunks):
+        # splits marked chunks into pieces, joining the last piece of each
+        # chunk to the first of the next
+        carry = ""
+        for chunk in chunks:
+            pieces = (carry + self.mark_sentences(chunk)).split('\t\t')
+            carry = pieces.pop()
+            yield from pieces
+        yield carry
+
+    def _chunks(self, lines):
+        # lines with the blank lines after them, so that a run of newlines
+        # is marked as one sentence end as in the whole text
+        chunk = ""
+        for line in lines:
+            if chunk and line.strip("\n"):
+                yield chunk
+                chunk = ""
+            chunk += line
+        if chunk:
+            yield chunk
+
+    def iter_sentences(self, text_or_file):
+        """
+        Yields the sentences of a string or a text file one by one, as
+        `sentence_tokenize` without verb separation would return them. The
+        input is read a line at a time; since every newline ends a
+        sentence, only the current line is held in memory.
+        """
+        lines = io.StringIO(text_or_file) if isinstance(text_or_file, str) else text_or_file
+        yield from self._join_dots(self._pieces(self._chunks(lines)))
+
     def sentence_tokenize(self, sentence, verb_seperator):
-        # finding the abbrevations
-        persian_abbrs = [x.group() for x in re.finditer(self.persian_pattern_abbreviation, sentence)]
-        english_abbrs = [x.group() for x in re.finditer(self.english_pattern_abbreviation, sentence)]
-        sentence = re.sub(self.persian_pattern_abbreviation, 'PERSIANABBRR', sentence)
-        sentence = re.sub(self.english_pattern_abbreviation, 'ENGGABBRR', sentence)
-        # finding the numbers
-        pattern = r"[-+]?\d*\.\d+|\d+"
-        nums_list = re.findall(pattern, sentence)
-        sentence = re.sub(pattern, 'FLOATPPOOOINTNUMBER', sentence)
-        # finding emails
-        emails = re.findall(self.mail_pattern, sentence)
-        sentence = re.sub(self.mail_pattern, "EEMMAAIILL", sentence)
-        # finding urls
-        urls = re.findall(self.url_pattern, sentence)
-        urls = [x[0] for x in urls]
-        sentence = re.sub(self.url_pattern, "UURRLLSS", sentence)
-
-        pattern = r'([!\.\?؟]+)[\n]*'
-        sentence = re.sub(pattern, self.add_tab, sentence)
-
-        pattern = r':\n'
-        sentence = re.sub(pattern, self.add_tab, sentence)
-
-        pattern = r';\n'
-        sentence = re.sub(pattern, self.add_tab, sentence)
-
-        pattern = r'؛\n'
-        sentence = re.sub(pattern, self.add_tab, sentence)
-
-        pattern = r'[\n]+'
-        sentence = re.sub(pattern, self.add_tab, sentence)
-
-        pattern = 'FLOATPPOOOINTNUMBER'
-        for number in nums_list:
-            sentence = re.sub(pattern, number, sentence, 1)
-        pattern = 'ENGGABBRR'
-        for english_abbr in english_abbrs:
-            sentence = re.sub(pattern, english_abbr, sentence, 1)
-        pattern = 'PERSIANABBRR'
-        for persian_abbr in persian_abbrs:
-            sentence = re.sub(pattern, persian_abbr, sentence, 1)
-        pattern = 'EEMMAAIILL'
-        for email in emails:
-            sentence = re.sub(pattern, email, sentence, 1)
-        pattern = 'UURRLLSS'
-        for url in urls:
-            sentence = re.sub(pattern, url, sentence, 1)
-        sentences = sentence.split('\t\t')
-        self.remove_space_in_dot(sentences)
-        sentences = [x for x in sentences if len(x.strip()) > 0]
+        sentences = list(self._join_dots(self._pieces([sentence])))
         if verb_seperator:
-            self.tagger = POSTagger(model=self.dir_path + "/resources/postagger.model")
-            for index in range(len(sentences)):
-                sentences_with_verb_seperator = self.verbSeperator(sentences[index])
-                sentences_with_verb_seperator.reverse()
-                sentences_with_verb_seperator = [x for x in sentences_with_verb_seperator if len(x.strip()) > 0]
-                if len(sentences_with_verb_seperator) > 1:
-                    self.remove_space_in_dot(sentences_with_verb_seperator)
-                    sentences.pop(index)
-                    for sent in sentences_with_verb_seperator:
-                        sentences.insert(index, sent)
+            sentences = self.separate_verbs(sentences)
         return sentences
 
-    def verbSeperator(self, line):
+    @property
+    def tagger(self):
+        return pos_tagger() if self._tagger is None else self._tagger
+
+    @tagger.setter
+    def tagger(self, tagger):
+        self._tagger = tagger
+
+    def separate_verbs(self, sentences):
+        """
+        Splits each of `sentences` after its verbs. The sentences are
+        tokenized once and tagged together in one `tag_sents` call.
+        """
+        tokenized = [self.word_tokenize(str(sentence)) for sentence in sentences]
+        tagged = iter(self.tagger.tag_sents([tokens for tokens in tokenized if tokens]))
+        separated = []
+        for sentence, tokens in zip(sentences, tokenized):
+            pieces = self.verbSeperator(sentence, tokens, next(tagged) if tokens else [])
+            pieces.reverse()
+            pieces = [x for x in pieces if len(x.strip()) > 0]
+            if len(pieces) > 1:
+                self.remove_space_in_dot(pieces)
+                pieces.reverse()
+                separated.extend(pieces)
+            else:
+                separated.append(sentence)
+        return separated
+
+    def verbSeperator(self, line, tokens=None, tagged=None):
         line = str(line)
+        if tokens is None:
+            tokens = self.word_tokenize(line)
+        if tagged is None:
+            tagged = self.tagger.tag(tokens)
+        verbs = [i for i, (_, tag) in enumerate(tagged) if tag == 'V']
+        if not verbs:
+            return [line]
+
         sentences = []
-        tagged = self.tagger.tag(self.word_tokenize(line))
-
-        has_verb = True
-        verb_count = 0
-        for i, word in enumerate(self.word_tokenize(line)):
-            if tagged[i][1] == 'V':
-                has_verb = False
-                verb_count += 1
-        if has_verb:
-            sentences.append(line)
-            return sentences
-
-        temp = ''
-        verb_found = 0
-        for i, word in enumerate(self.word_tokenize(line)):
-            temp = temp + ' ' + word
-            if tagged[i][1] == 'V':
-                verb_found += 1
-                sentences.append(temp)
-                temp = ''
-            if i == len(self.word_tokenize(line)) - 1 and verb_count == verb_found and tagged[i][1] != 'V':
-                sentences.append(temp)
+        start = 0
+        for verb in verbs:
+            sentences.append(' ' + ' '.join(tokens[start:verb + 1]))
+            start = verb + 1
+        if start < len(tokens):
+            sentences.append(' ' + ' '.join(tokens[start:]))
         return sentences
 
     def is_mix(self, word):
@@ -191,53 +283,76 @@ class Tokenizer:
         else:
             return language, word, None
 
-    def word_tokenize(self, sentence):
-        emails = re.findall(self.mail_pattern, sentence)
-        sentence = re.sub(self.mail_pattern, "EEMMAAIILL", sentence)
-        urls = re.findall(self.url_pattern, sentence)
-        urls = [x[0] for x in urls]
-        sentence = re.sub(self.url_pattern, "UURRLLSS", sentence)
-        hashtags = re.findall(self.hashtag_pattern, sentence)
-        sentence = re.sub(self.hashtag_pattern, "HHAASHSHTTAAGG", sentence)
-        mentions = re.findall(self.mention_pattern, sentence)
-        sentence = re.sub(self.mention_pattern, "MMEENNTION", sentence)
-        for index in range(len(hashtags)):
-            language, _, _ = self.is_mix(hashtags[index])
-            if language == "English":
-                hashtags[index] = hashtags[index] + "#"
+    def protected_spans(self, sentence):
+        """
+        Returns the ``(start, end, kind)`` spans of the emails, urls, hashtags
+        and mentions of `sentence` in order. Spans already claimed are masked
+        with letters before the next kind is searched for, so they count as
+        words to its boundaries; matches reaching into them are dropped.
+        """
+        spans = []
+        masked = sentence
+        claimed = bytearray(len(sentence))
+        for kind, pattern in (("email", self.mail_pattern), ("url", self.url_pattern),
+                              ("hashtag", self.hashtag_pattern), ("mention", self.mention_pattern)):
+            found = [(match.start(), match.end(), kind) for match in pattern.finditer(masked)
+                     if claimed.find(1, match.start(), match.end()) == -1]
+            if not found:
+                continue
+            pieces, position = [], 0
+            for start, end, _ in found:
+                claimed[start:end] = b"\x01" * (end - start)
+                pieces.append(masked[position:start])
+                pieces.append("X" * (end - start))
+                position = end
+            pieces.append(masked[position:])
+            masked = "".join(pieces)
+            spans = sorted(spans + found)
+        return spans
+
+    def _split(self, sentence, start, end, spans):
+        for match in self.token_pattern.finditer(sentence, start, end):
+            token_start, token_end = match.span()
+            if match.lastgroup == "punctuation" and token_end - token_start > 1:
+                # digits of some scripts are emojis as well, and split apart
+                for emoji in self.emoji_pattern.finditer(sentence, token_start, token_end):
+                    if emoji.start() > token_start:
+                        spans.append((token_start, emoji.start(), None))
+                    spans.append((emoji.start(), emoji.end(), None))
+                    token_start = emoji.end()
+                if token_start == token_end:
+                    continue
+            spans.append((token_start, token_end, None))
+
+    def word_tokenize(self, sentence, offsets=False):
+        """
+        Splits `sentence` into words, punctuation, numbers and emojis in one
+        pass, keeping emails, urls, hashtags and mentions whole and splitting
+        words that mix English and Persian. Hashtags read "#tag", or "tag#"
+        when English. With `offsets`, returns the ``(start, end)`` span of
+        each token in `sentence` instead of the tokens.
+        """
+        spans = []
+        position = 0
+        for start, end, kind in self.protected_spans(sentence):
+            self._split(sentence, position, start, spans)
+            spans.append((start, end, kind))
+            position = end
+        self._split(sentence, position, len(sentence), spans)
+
+        tokens = []
+        for start, end, kind in spans:
+            while start < end and sentence[start] == "\u200c":
+                start += 1
+            while end > start and sentence[end - 1] == "\u200c":
+                end -= 1
+            if start == end:
+                continue
+            if offsets:
+                tokens.append((start, end))
+            elif kind == "hashtag":
+                tag = sentence[start + 1:end]
+                tokens.append(tag + "#" if tag.isascii() and tag.isalpha() else "#" + tag)
             else:
-                hashtags[index] = "#" + hashtags[index]
-        sentence = re.sub(self.punctuation_pattern, r' \1 ', sentence)
-        sentence = re.sub(self.emoji_pattern, r' \1 ', sentence)
-        sentence = sentence.replace('\n', ' ').replace('\t', ' ')
-        tokens = sentence.strip().split()
-        for token in tokens:
-            language, word1, word2 = self.is_mix(token)
-            if language == "mix":
-                index_of_element = tokens.index(token)
-                tokens.pop(index_of_element)
-                tokens.insert(index_of_element, word1)
-                tokens.insert(index_of_element, word2)
-            if token == "EEMMAAIILL":
-                index_of_email = tokens.index("EEMMAAIILL")
-                tokens.pop(index_of_email)
-                tokens.insert(index_of_email, emails[0])
-                emails.pop(0)
-            if token == "UURRLLSS":
-                index_of_url = tokens.index("UURRLLSS")
-                tokens.pop(index_of_url)
-                tokens.insert(index_of_url, str(urls[0]))
-                urls.pop(0)
-            if token == "HHAASHSHTTAAGG":
-                index_of_hashtag = tokens.index("HHAASHSHTTAAGG")
-                tokens.pop(index_of_hashtag)
-                tokens.insert(index_of_hashtag, str(hashtags[0]))
-                hashtags.pop(0)
-            if token == "MMEENNTION":
-                index_of_mention = tokens.index("MMEENNTION")
-                tokens.pop(index_of_mention)
-                tokens.insert(index_of_mention, mentions[0])
-                mentions.pop(0)
-        tokens = [x.strip("\u200c") for x in tokens if len(x.strip("\u200c")) != 0]
-        tokens = [x.strip() for x in tokens]
+                tokens.append(sentence[start:end])
         return tokens
@@ -1,2 +1,28 @@
-from .parsnorm import ParsNorm
-from .en_fa_transliterate import EnFaTransliterate
\ No newline at end of file
+import importlib
+
+__version__ = "0.1.0"
+
+# Public names are resolved on first access (PEP 562), so importing the package
+# does not pull in hazm, nltk or the CMU dictionary until they are needed.
+_LAZY_ATTRIBUTES = {
+    "ParsNorm": ".parsnorm",
+    "NormalizationPlan": ".parsnorm",
+    "EnFaTransliterate": ".en_fa_transliterate",
+    "StageProfiler": ".profiler",
+    "AsyncNormalizer": ".aio",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
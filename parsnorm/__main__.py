@@ -0,0 +1,119 @@
+"""
+Command line interface for normalizing large corpora.
+
+Examples
+--------
+Normalize a text file with all CPUs::
+
+    python -m parsnorm corpus.txt -o corpus.norm.txt
+
+Normalize the ``text`` field of a JSONL manifest read from stdin::
+
+    cat manifest.jsonl | python -m parsnorm --field text --disable hazm > manifest.norm.jsonl
+
+Blank lines of a JSONL input are written back as blank lines, so the output
+stays line for line with the input. The command stops quietly when its
+reader goes away, as with ``| head``.
+
+"""
+import os
+import sys
+import json
+import queue
+import argparse
+import threading
+from parsnorm.parsnorm import ParsNorm, NORMALIZE_DEFAULTS
+
+_DONE = object()
+
+
+def _write(results, output, jsonl, errors):
+    try:
+        while True:
+            result = results.get()
+            if result is _DONE:
+                output.flush()
+                return
+            if jsonl:
+                result = "" if result is None else json.dumps(result, ensure_ascii=False)
+            output.write(result + "\n")
+    except BaseException as error:
+        # handed to `main`, which stops normalizing and raises it
+        errors.append(error)
+
+
+def _put(results, item, writer, errors):
+    # a writer that died never empties the queue again, so never wait on it
+    # for long
+    while True:
+        try:
+            results.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            if not writer.is_alive():
+                raise errors[0] if errors else RuntimeError("the writer thread stopped")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m parsnorm",
+                                     description="Normalize Persian text line by line.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="UTF-8 text or JSONL file to normalize (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="where to write the results (default: stdout)")
+    parser.add_argument("--field", help="read JSONL and normalize this field of every record")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--chunksize", type=int, default=256, help="lines sent to a worker at a time")
+    parser.add_argument("--queue-size", type=int, default=1024,
+                        help="results buffered for the writer before normalization waits")
+    parser.add_argument("--enable", nargs="+", default=[], choices=NORMALIZE_DEFAULTS, metavar="OPTION",
+                        help="normalize options to turn on")
+    parser.add_argument("--disable", nargs="+", default=[], choices=NORMALIZE_DEFAULTS, metavar="OPTION",
+                        help="normalize options to turn off")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {name: True for name in args.enable}
+    options.update({name: False for name in args.disable})
+
+    source = sys.stdin if args.input == "-" else args.input
+    if source is sys.stdin:
+        source = (line.rstrip("\n") for line in sys.stdin)
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    # the writer runs in its own thread behind a bounded queue, so writing
+    # overlaps normalization and a slow sink holds back the readers
+    results = queue.Queue(maxsize=args.queue_size)
+    errors = []
+    writer = threading.Thread(target=_write, args=(results, output, args.field is not None, errors), daemon=True)
+    writer.start()
+    stream = None
+    normalizer = ParsNorm()
+    try:
+        stream = normalizer.normalize_stream(source, workers=args.workers, chunksize=args.chunksize,
+                                             field=args.field, **options)
+        for result in stream:
+            if errors:
+                raise errors[0]
+            _put(results, result, writer, errors)
+        _put(results, _DONE, writer, errors)
+        writer.join()
+        if errors:
+            raise errors[0]
+    except BrokenPipeError:
+        # the reader has gone away, which is how `| head` ends a run; output
+        # that is still buffered goes to devnull instead of failing at exit
+        if output is sys.stdout:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if stream is not None:
+            stream.close()
+        # stops the workers, also those still busy with an interrupted stream
+        normalizer.close()
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
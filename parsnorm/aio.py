@@ -0,0 +1,115 @@
+"""
+Asynchronous normalization
+==========================
+
+`normalize` is CPU bound and takes tens of milliseconds on long documents,
+which blocks an event loop when called inline. `AsyncNormalizer` runs it in
+an executor instead and bounds how many texts are being normalized at once,
+so a burst of long documents queues up rather than saturating the executor.
+
+The concurrency slot of a text is only given back when its work is really
+done. A cancelled text that has not started yet is dropped; one that is
+already running finishes in the background but its result is discarded.
+
+"""
+import os
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from parsnorm import parallel
+
+
+class AsyncNormalizer:
+    """
+    AsyncNormalizer
+    ---------------
+    Awaitable normalization backed by a thread or process pool.
+
+    Parameters
+    ----------
+    normalizer : ParsNorm
+        The instance whose configuration is used.
+    executor : {"thread", "process"}, optional
+        Threads share `normalizer` and keep the event loop responsive but
+        are bound to one core by the GIL; processes each hold their own
+        `ParsNorm` and normalize in parallel. Default is "thread".
+    workers : int, optional
+        Size of the pool. Default is the number of CPUs.
+    max_concurrency : int, optional
+        Maximum number of texts submitted to the pool at once. Default is
+        `workers`.
+    """
+    def __init__(self, normalizer, executor="thread", workers=None, max_concurrency=None):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', not {executor!r}")
+        self.normalizer = normalizer
+        self.kind = executor
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.workers
+        self._executor = None
+        # asyncio primitives belong to one event loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            if self.kind == "thread":
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="parsnorm")
+            else:
+                self._executor = parallel.create_executor(self.normalizer, self.workers)
+        return self._executor
+
+    def _semaphore(self, loop):
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def normalize(self, text, **options):
+        """
+        Normalizes `text` in the executor with the options of
+        `ParsNorm.normalize` and returns the result.
+        """
+        plan = self.normalizer.compile(**options)
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(loop)
+        await semaphore.acquire()
+        try:
+            if self.kind == "thread":
+                future = self.executor.submit(plan, text)
+            else:
+                future = self.executor.submit(parallel._normalize_with_options, text, plan.options)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def normalize_many(self, texts, **options):
+        """
+        Normalizes all `texts` concurrently, within the concurrency limit,
+        and returns the results in input order. If one text fails or the
+        call is cancelled, the texts that have not started are cancelled.
+        """
+        tasks = [asyncio.ensure_future(self.normalize(text, **options)) for text in texts]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def shutdown(self, wait=True):
+        """Stops the executor; it is started again on the next call."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.shutdown(wait=False)
@@ -0,0 +1,349 @@
+"""
+Offset alignment
+================
+
+Maps characters of a normalized text back to the spans of the original text
+they came from, as needed to cut CTC segments out of the original
+transcript.
+
+Every stage reports its changes as *edits*: ``(start, end, length)``
+triples, sorted and non-overlapping, saying that ``text[start:end]`` of the
+stage input became `length` characters of its output. Stages produce their
+edits while they run, from their own matches (`Substitution`,
+`Translation`, `Chain`, `Passes`, `Replacements`, `Characterwise`, or an
+``align`` method of their own). `OffsetMap.compose` chains the edits of consecutive stages into one
+map from the final text to the original.
+
+Only a stage without ``align``, such as a function added by a user, is
+aligned by diffing its input and output (`diff_edits`). That costs time
+quadratic in the length of the changed part, so every built-in stage
+reports its edits instead.
+
+An `OffsetMap` is stored as runs instead of per character: a run is either
+copied, mapping its characters one to one to the original, or replaced,
+mapping all of its characters to the one original span they replaced.
+
+"""
+import re
+import array
+import bisect
+import difflib
+
+
+class OffsetMap:
+    """
+    OffsetMap
+    ---------
+    Maps positions of a normalized text to spans of the original text.
+
+    Attributes
+    ----------
+    length : int
+        Length of the normalized text.
+    source_length : int
+        Length of the original text.
+
+    Methods
+    -------
+    span(start, end=None)
+        Returns the ``(start, end)`` span of the original text that produced
+        characters `start` to `end` of the normalized text.
+
+    to_arrays()
+        Returns per character original starts and ends as two arrays.
+    """
+    def __init__(self, source_length, length=None):
+        # the identity map of a text of `source_length` characters, or with a
+        # `length` an empty map that `compose` fills in
+        self.source_length = source_length
+        self.length = source_length if length is None else length
+        # run k starts at normalized position starts[k] and maps to the
+        # original span source_starts[k]:source_ends[k]; copied[k] tells whether
+        # it maps one to one or wholesale
+        self.starts = array.array("q")
+        self.source_starts = array.array("q")
+        self.source_ends = array.array("q")
+        self.copied = bytearray()
+        if length is None and source_length:
+            self._append(0, source_length, 0, source_length, True)
+
+    def _append(self, start, end, source_start, source_end, copied):
+        if copied and self.copied and self.copied[-1]:
+            # merge runs that continue each other in both texts
+            last = len(self.starts) - 1
+            if self.source_ends[last] == source_start and \
+                    self.starts[last] + self.source_ends[last] - self.source_starts[last] == start:
+                self.source_ends[last] = source_end
+                return
+        self.starts.append(start)
+        self.source_starts.append(source_start)
+        self.source_ends.append(source_end)
+        self.copied.append(copied)
+
+    def _run(self, position):
+        return bisect.bisect_right(self.starts, position) - 1
+
+    def _source_start(self, position):
+        if position >= self.length:
+            return self.source_length
+        run = self._run(position)
+        if self.copied[run]:
+            return self.source_starts[run] + position - self.starts[run]
+        return self.source_starts[run]
+
+    def _source_end(self, position):
+        run = self._run(position)
+        if self.copied[run]:
+            return self.source_starts[run] + position - self.starts[run] + 1
+        return self.source_ends[run]
+
+    def span(self, start, end=None):
+        if end is None:
+            end = start + 1
+        if end <= start:
+            position = self._source_start(start)
+            return position, position
+        return self._source_start(start), self._source_end(end - 1)
+
+    def compose(self, edits, length):
+        """
+        Returns the map of the text that results from applying `edits` to
+        the text this map describes; `length` is the length of the result.
+        """
+        composed = OffsetMap(self.source_length, length)
+        position = output = 0
+        for start, end, replacement_length in edits:
+            if start > position:
+                self._copy_runs(composed, position, start, output)
+                output += start - position
+            if replacement_length:
+                if end > start:
+                    source_start, source_end = self._source_start(start), self._source_end(end - 1)
+                else:
+                    source_start = source_end = self._source_start(start)
+                composed._append(output, output + replacement_length, source_start, source_end, False)
+                output += replacement_length
+            position = end
+        if position < self.length:
+            self._copy_runs(composed, position, self.length, output)
+        return composed
+
+    def _copy_runs(self, composed, start, end, output):
+        # carries the runs of this map covering start:end over unchanged
+        run = self._run(start)
+        while run < len(self.starts) and self.starts[run] < end:
+            run_start = self.starts[run]
+            run_end = self.starts[run + 1] if run + 1 < len(self.starts) else self.length
+            piece_start, piece_end = max(start, run_start), min(end, run_end)
+            piece_output = output + piece_start - start
+            if self.copied[run]:
+                source_start = self.source_starts[run] + piece_start - run_start
+                composed._append(piece_output, piece_output + piece_end - piece_start,
+                                 source_start, source_start + piece_end - piece_start, True)
+            else:
+                composed._append(piece_output, piece_output + piece_end - piece_start,
+                                 self.source_starts[run], self.source_ends[run], False)
+            run += 1
+
+    def to_arrays(self):
+        starts, ends = array.array("q"), array.array("q")
+        for run in range(len(self.starts)):
+            run_end = self.starts[run + 1] if run + 1 < len(self.starts) else self.length
+            size = run_end - self.starts[run]
+            if self.copied[run]:
+                starts.extend(range(self.source_starts[run], self.source_starts[run] + size))
+                ends.extend(range(self.source_starts[run] + 1, self.source_starts[run] + size + 1))
+            else:
+                starts.extend([self.source_starts[run]] * size)
+                ends.extend([self.source_ends[run]] * size)
+        return starts, ends
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return f"OffsetMap(length={self.length}, source_length={self.source_length}, runs={len(self.starts)})"
+
+
+def diff_edits(source, output):
+    """
+    Recovers the edits that turn `source` into `output` by diffing them.
+    Only a fallback for third-party stages that cannot report their edits,
+    as it is quadratic in the length of the changed part; every built-in
+    stage has an ``align`` method instead.
+    """
+    if source == output:
+        return []
+    prefix = 0
+    limit = min(len(source), len(output))
+    while prefix < limit and source[prefix] == output[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and source[-1 - suffix] == output[-1 - suffix]:
+        suffix += 1
+    source_middle = source[prefix:len(source) - suffix]
+    output_middle = output[prefix:len(output) - suffix]
+    matcher = difflib.SequenceMatcher(None, source_middle, output_middle, autojunk=False)
+    return [(prefix + i1, prefix + i2, j2 - j1)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+def align(stage, text, offsets):
+    """
+    Runs `stage` on `text` and returns its output with `offsets` composed
+    with the stage's edits. Stages without an ``align`` method, which no
+    built-in stage is, are diffed.
+    """
+    aligned = getattr(stage, "align", None)
+    if aligned is not None:
+        return aligned(text, offsets)
+    output = stage(text)
+    return output, offsets.compose(diff_edits(text, output), len(output))
+
+
+class Substitution:
+    """
+    Substitution
+    ------------
+    A callable ``pattern.sub(replace, text)`` that can also report its
+    edits. `pattern` is a compiled regex, or a function of the text that
+    returns the one to use for it. `replace` is a string, taken literally,
+    or a function of the match.
+    """
+    def __init__(self, pattern, replace):
+        self.pattern = pattern
+        self.pattern_for = pattern if callable(pattern) else (lambda text: pattern)
+        self.replace = replace if callable(replace) else (lambda match: replace)
+
+    def __call__(self, text):
+        return self.pattern_for(text).sub(self.replace, text)
+
+    def edits(self, text):
+        pieces, edits = [], []
+        position = 0
+        for match in self.pattern_for(text).finditer(text):
+            replacement = self.replace(match)
+            start, end = match.span()
+            pieces.append(text[position:start])
+            pieces.append(replacement)
+            if replacement != text[start:end]:
+                edits.append((start, end, len(replacement)))
+            position = end
+        pieces.append(text[position:])
+        return "".join(pieces), edits
+
+    def align(self, text, offsets):
+        output, edits = self.edits(text)
+        return output, offsets.compose(edits, len(output)) if edits else offsets
+
+
+class Translation:
+    """
+    Translation
+    -----------
+    A callable ``text.translate(table)`` that can also report its edits.
+    Characters translated to exactly one character keep their offsets, so
+    only deletions and expansions are edits.
+    """
+    def __init__(self, table):
+        self.table = table
+        resizing = [chr(code) for code, value in table.items()
+                    if value is None or (isinstance(value, str) and len(value) != 1)]
+        self.resizing_pattern = re.compile("[{}]".format("".join(map(re.escape, resizing)))) if resizing else None
+
+    def __call__(self, text):
+        return text.translate(self.table)
+
+    def align(self, text, offsets):
+        output = text.translate(self.table)
+        if self.resizing_pattern is None:
+            return output, offsets
+        edits = [(match.start(), match.end(), len(match.group().translate(self.table)))
+                 for match in self.resizing_pattern.finditer(text)]
+        return output, offsets.compose(edits, len(output)) if edits else offsets
+
+
+class Chain:
+    """
+    Chain
+    -----
+    A callable that runs several stages in turn as one.
+    """
+    def __init__(self, *steps):
+        self.steps = steps
+
+    def __call__(self, text):
+        for step in self.steps:
+            text = step(text)
+        return text
+
+    def align(self, text, offsets):
+        for step in self.steps:
+            text, offsets = align(step, text, offsets)
+        return text, offsets
+
+
+class Replacements:
+    """
+    Replacements
+    ------------
+    A callable that runs ``text.replace(old, new)`` in turn for every
+    ``(old, new)`` pair `find` returns for its input, and can also report
+    the edits.
+    """
+    def __init__(self, find):
+        self.find = find
+
+    def __call__(self, text):
+        for old, new in self.find(text):
+            text = text.replace(old, new)
+        return text
+
+    def align(self, text, offsets):
+        for old, new in list(self.find(text)):
+            text, offsets = Substitution(re.compile(re.escape(old)), new).align(text, offsets)
+        return text, offsets
+
+
+class Passes:
+    """
+    Passes
+    ------
+    A callable that runs ``(literal, stage)`` pairs in turn, skipping every
+    stage whose `literal` does not occur in the text it would get.
+    """
+    def __init__(self, passes):
+        self.passes = passes
+
+    def __call__(self, text):
+        for literal, stage in self.passes:
+            if literal in text:
+                text = stage(text)
+        return text
+
+    def align(self, text, offsets):
+        for literal, stage in self.passes:
+            if literal in text:
+                text, offsets = align(stage, text, offsets)
+        return text, offsets
+
+
+class Characterwise:
+    """
+    Characterwise
+    -------------
+    Wraps a function that replaces every character by exactly one character,
+    so offsets are unchanged by it. A function that changes the length of a
+    text breaks that contract and raises ValueError when aligned.
+    """
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, text):
+        return self.function(text)
+
+    def align(self, text, offsets):
+        output = self.function(text)
+        if len(output) != len(text):
+            raise ValueError(f"{self.function!r} changed the length of a text from {len(text)} to {len(output)}")
+        return output, offsets
@@ -0,0 +1,250 @@
+"""
+Result caches
+=============
+
+Corpora such as subtitles, headlines and chat logs repeat the same lines
+many times. A cache given to `ParsNorm` returns the stored result for a text
+it has already normalized with the same options, skipping the pipeline.
+
+`ResultCache` keeps results in memory for the life of the instance;
+`DiskCache` keeps them in an SQLite database shared by processes and runs.
+
+A cache is only correct when outputs are a pure function of the text, so
+`ParsNorm` refuses both with the "random" `template_policy`: the first
+random reading of a text would be returned for all its repetitions.
+
+"""
+import os
+import sys
+import sqlite3
+import hashlib
+import threading
+import collections
+from importlib import metadata
+
+# Distributions whose behaviour is part of the normalization rules.
+RULE_DEPENDENCIES = ("hazm", "num2fawords", "persian-tools", "nltk")
+
+
+class ResultCache:
+    """
+    ResultCache
+    -----------
+    A least recently used cache of normalized texts, bounded by the number
+    of entries and optionally by their approximate size in bytes.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries.
+    max_bytes : int, optional
+        Maximum total size of the cached texts and results, as measured by
+        `sys.getsizeof`.
+    """
+    def __init__(self, maxsize=65536, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.entries = collections.OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # plans may be called from the threads of `anormalize`
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = sys.getsizeof(key[-1]) + sys.getsizeof(value)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.entries[key] = (value, size)
+            self.bytes += size
+            while len(self.entries) > self.maxsize or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.hits = self.misses = 0
+
+    def info(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.entries),
+                "maxsize": self.maxsize,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes}
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def rules_fingerprint():
+    """
+    Digest of everything that decides a normalized text apart from the
+    options: the source of parsnorm and parsinorm, which also holds their
+    tables, and the versions of the libraries they rely on.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    for package in ("parsnorm", "parsinorm"):
+        directory = os.path.join(root, package)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                digest.update(name.encode("utf-8"))
+                with open(os.path.join(directory, name), "rb") as source:
+                    digest.update(source.read())
+    for distribution in RULE_DEPENDENCIES:
+        try:
+            version = metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            version = None
+        digest.update(f"{distribution}={version};".encode("utf-8"))
+    return digest.digest()
+
+
+class DiskCache:
+    """
+    DiskCache
+    ---------
+    A persistent cache of normalized texts in an SQLite database. Entries
+    are keyed by a hash of the text, the option set, and a namespace made of
+    the library version, `rules_fingerprint` and the configuration of the
+    `ParsNorm` instance, so results of older rules or other configurations
+    are never returned. `prune` deletes them.
+
+    The database runs in write-ahead-log mode, so any number of processes
+    and threads can read and write it at the same time; every process and
+    thread opens its own connection on first use.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The database file, created if missing.
+    namespace : bytes or str
+        Identifies what produced the results, see `ParsNorm`.
+    timeout : float
+        Seconds to wait for another writer before giving up.
+    """
+    def __init__(self, path, namespace=b"", timeout=30.0):
+        self.path = os.fspath(path)
+        self.namespace = hashlib.blake2b(namespace.encode("utf-8") if isinstance(namespace, str) else namespace,
+                                         digest_size=16).digest()
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.local = threading.local()
+        self.connect()
+
+    def connect(self):
+        # connections must not cross a fork, so they are kept per process
+        connection = getattr(self.local, "connection", None)
+        if connection is not None and self.local.pid == os.getpid():
+            return connection
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS results ("
+                           "namespace BLOB NOT NULL, options INTEGER NOT NULL, text_hash BLOB NOT NULL, "
+                           "result TEXT NOT NULL, PRIMARY KEY (namespace, options, text_hash)) WITHOUT ROWID")
+        self.local.connection, self.local.pid = connection, os.getpid()
+        return connection
+
+    @staticmethod
+    def text_hash(text):
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def get(self, key):
+        options, text = key
+        row = self.connect().execute(
+            "SELECT result FROM results WHERE namespace = ? AND options = ? AND text_hash = ?",
+            (self.namespace, options, self.text_hash(text))).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, key, value):
+        options, text = key
+        self.connect().execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                               (self.namespace, options, self.text_hash(text), value))
+
+    def clear(self):
+        """Deletes the entries of this namespace and resets the statistics."""
+        self.connect().execute("DELETE FROM results WHERE namespace = ?", (self.namespace,))
+        self.hits = self.misses = 0
+
+    def prune(self):
+        """Deletes the entries of every other namespace and returns how many."""
+        cursor = self.connect().execute("DELETE FROM results WHERE namespace != ?", (self.namespace,))
+        return cursor.rowcount
+
+    def info(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self),
+                "bytes": sum(os.path.getsize(self.path + suffix) for suffix in ("", "-wal")
+                             if os.path.exists(self.path + suffix))}
+
+    def __len__(self):
+        return self.connect().execute("SELECT COUNT(*) FROM results WHERE namespace = ?",
+                                      (self.namespace,)).fetchone()[0]
+
+
+class ChainedCache:
+    """
+    ChainedCache
+    ------------
+    Looks results up in several caches in turn, usually a `ResultCache` in
+    front of a `DiskCache`, and copies what a later one finds into the
+    earlier ones.
+    """
+    def __init__(self, *caches):
+        self.caches = caches
+
+    def get(self, key):
+        for level, cache in enumerate(self.caches):
+            value = cache.get(key)
+            if value is not None:
+                for earlier in self.caches[:level]:
+                    earlier.put(key, value)
+                return value
+        return None
+
+    def put(self, key, value):
+        for cache in self.caches:
+            cache.put(key, value)
+
+    def clear(self):
+        for cache in self.caches:
+            cache.clear()
+
+    def prune(self):
+        """Prunes every level that can be pruned and returns how many entries went."""
+        return sum(cache.prune() for cache in self.caches if hasattr(cache, "prune"))
+
+    def info(self):
+        first, last = self.caches[0].info(), self.caches[-1].info()
+        lookups = first["hits"] + first["misses"]
+        hits = lookups - last["misses"]
+        return {"hits": hits,
+                "misses": last["misses"],
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "levels": [cache.info() for cache in self.caches]}
@@ -1,10 +1,8 @@
 import re
-import nltk
 import os
-from nltk.corpus import cmudict
 
-# Load the CMU Pronouncing Dictionary
-pronouncing_dict = cmudict.dict()
+# The CMU Pronouncing Dictionary is loaded on first use by get_pronouncing_dict()
+_pronouncing_dict = None
 
 # Add the word 'frightner' to a custom dictionary
 custom_dict = {
@@ -18,7 +16,24 @@ custom_dict = {
     "revenant": [["R", "EH1", "V", "AH0", "N", "AH0", "NT"]],
     "revenant": [["R", "EH1", "V", "AH0", "N", "AH0", "NT", "Z"]]
 }
-pronouncing_dict.update(custom_dict)
+
+
+def get_pronouncing_dict():
+    """Returns the CMU Pronouncing Dictionary merged with `custom_dict`, loading it once."""
+    global _pronouncing_dict
+    if _pronouncing_dict is None:
+        from nltk.corpus import cmudict
+        pronouncing_dict = cmudict.dict()
+        pronouncing_dict.update(custom_dict)
+        _pronouncing_dict = pronouncing_dict
+    return _pronouncing_dict
+
+
+def __getattr__(name):
+    # keeps the module level `pronouncing_dict` name working without loading it at import
+    if name == "pronouncing_dict":
+        return get_pronouncing_dict()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 WEB_TO_FA = {
     "http": "اچ تی تی پی",
@@ -211,8 +226,29 @@ def transliterate_abbreviations(text):
 
 
 class EnFaTransliterate:
-    def __init__(self):
+    def __init__(self, lexicon_path=None):
+        """
+        `lexicon_path` points to a lexicon built by `parsnorm.lexicon`. With
+        None the default lexicon is used when it has been built and is up to
+        date, otherwise words are transliterated from the CMU dictionary.
+        False always uses the CMU dictionary.
+        """
         self.web_to_fa = WEB_TO_FA
+        self.lexicon_path = lexicon_path
+        self._lexicon = None
+
+    @property
+    def lexicon(self):
+        if self._lexicon is None and self.lexicon_path is not False:
+            from parsnorm.lexicon import MappedLexicon, DEFAULT_LEXICON_PATH
+            if self.lexicon_path is not None:
+                self._lexicon = MappedLexicon(self.lexicon_path)
+            else:
+                try:
+                    self._lexicon = MappedLexicon(DEFAULT_LEXICON_PATH)
+                except (OSError, ValueError):
+                    self.lexicon_path = False
+        return self._lexicon
 
     def en_fa_transliterate(self, word):
         # Transliterate
@@ -235,8 +271,13 @@ class EnFaTransliterate:
         return persian
     
     # Function to convert word to IPA using CMU Pronouncing Dictionary and ARPAbet to IPA conversion
-    def transliterate(self, word, d=pronouncing_dict):
+    def transliterate(self, word, d=None):
+        if d is None and self.lexicon is not None:
+            # precomputed transliterations, see parsnorm.lexicon
+            return self.lexicon.get(word.lower())
         # Get ARPAbet transcription from CMU dictionary
+        if d is None:
+            d = get_pronouncing_dict()
         word = word.lower()
         if word in d:
             arpabet_transcription = d[word][0]  # Take the first pronunciation
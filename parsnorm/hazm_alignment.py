@@ -0,0 +1,202 @@
+"""
+Aligned hazm normalization
+==========================
+
+`hazm.Normalizer.normalize` is a fixed sequence of translations, regex
+substitutions, a re-spacing of tokens and two word replacement loops.
+`HazmNormalization` replays that sequence step by step as alignment stages,
+so `normalize_with_offsets` gets the edits of the hazm stage from the same
+matches that make its output instead of diffing its input and output.
+
+Plain calls still go straight to ``Normalizer.normalize``.
+
+The replay reads attributes of the normalizer, private ones included, and
+follows the order of its steps, so it is only used with the hazm releases it
+was checked against. With any other release, or a normalizer that lacks one
+of the attributes, the hazm stage is aligned by diffing (`diff_edits`).
+
+"""
+import re
+import warnings
+from importlib import metadata
+from parsnorm.alignment import Substitution, Translation, Replacements, diff_edits
+
+# releases whose `Normalizer.normalize` the replay matches
+SUPPORTED_HAZM_VERSIONS = ("0.10.",)
+# the attributes of `Normalizer` the replay reads
+NORMALIZER_ATTRIBUTES = (
+    "translation_src", "translation_dst", "_persian_style", "persian_style_patterns", "_persian_number",
+    "number_translation_src", "number_translation_dst", "_remove_diacritics", "diacritics_patterns",
+    "_correct_spacing", "extra_space_patterns", "tokenizer", "token_spacing", "affix_spacing_patterns",
+    "punctuation_spacing_patterns", "_unicodes_replacement", "replacements", "_remove_specials_chars",
+    "specials_chars_patterns", "_decrease_repeated_chars", "repeated_chars_pattern",
+    "more_than_two_repeat_pattern", "words", "_seperate_mi", "joint_mi_patterns", "verbs",
+)
+
+
+def hazm_version():
+    try:
+        return metadata.version("hazm")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _pattern_steps(patterns):
+    # hazm applies (pattern, template) pairs with re.sub, whose template
+    # expansion is that of `match.expand`
+    return [Substitution(re.compile(pattern), lambda match, template=template: match.expand(template))
+            for pattern, template in patterns]
+
+
+def _translation_table(source, destination):
+    return {ord(character): replacement for character, replacement in zip(source, destination)}
+
+
+class TokenSpacing:
+    """
+    TokenSpacing
+    ------------
+    The token pass of ``Normalizer.correct_spacing``: every line is split
+    into tokens, which are joined again with one space, or with a zero width
+    non-joiner where `token_spacing` merges them.
+    """
+    def __init__(self, normalizer):
+        self.normalizer = normalizer
+
+    def __call__(self, text):
+        return self.align(text, None)[0]
+
+    def align(self, text, offsets):
+        pieces, edits = [], []
+        line_start = 0
+        for line in text.split("\n"):
+            if pieces:
+                pieces.append("\n")
+            tokens = self.normalizer.tokenizer.tokenize(line)
+            # the tokens are pieces of the line in order, around spaces and tabs
+            spans, position = [], 0
+            for token in tokens:
+                start = line.index(token, position)
+                position = start + len(token)
+                spans.append((start, position))
+            spaced = self.normalizer.token_spacing(tokens)
+            position, index = 0, 0
+            for merged in spaced:
+                parts = 1
+                while sum(end - start for start, end in spans[index:index + parts]) + parts - 1 < len(merged):
+                    parts += 1
+                for part in range(index, index + parts):
+                    start, end = spans[part]
+                    separator = "" if part == 0 else ("\u200c" if part > index else " ")
+                    if line[position:start] != separator:
+                        edits.append((line_start + position, line_start + start, len(separator)))
+                    position = end
+                index += parts
+            if position < len(line):
+                edits.append((line_start + position, line_start + len(line), 0))
+            pieces.append(" ".join(spaced))
+            line_start += len(line) + 1
+        output = "".join(pieces)
+        if offsets is None or not edits:
+            return output, offsets
+        return output, offsets.compose(edits, len(output))
+
+
+class HazmNormalization:
+    """
+    HazmNormalization
+    -----------------
+    A hazm `Normalizer` as a normalization stage that reports its edits.
+    Calling it runs ``normalizer.normalize``; `align` replays the same steps
+    with the settings of `normalizer` and gives the same text, or diffs the
+    output of ``normalizer.normalize`` when the replay is not `supported`.
+
+    Parameters
+    ----------
+    normalizer : hazm.Normalizer
+        The normalizer to run.
+    """
+    def __init__(self, normalizer):
+        self.normalizer = normalizer
+        self._steps = None
+        self._supported = None
+
+    def __call__(self, text):
+        return self.normalizer.normalize(text)
+
+    @property
+    def supported(self):
+        """Whether the installed hazm and `normalizer` are ones the replay matches."""
+        if self._supported is None:
+            version = hazm_version()
+            self._supported = (version is not None and version.startswith(SUPPORTED_HAZM_VERSIONS)
+                               and all(hasattr(self.normalizer, name) for name in NORMALIZER_ATTRIBUTES))
+            if not self._supported:
+                warnings.warn(f"offsets of hazm {version} are found by diffing, which is slow on long texts; "
+                              f"parsnorm replays hazm {', '.join(SUPPORTED_HAZM_VERSIONS)}x only",
+                              RuntimeWarning, stacklevel=3)
+        return self._supported
+
+    @property
+    def steps(self):
+        # built on first use, as most plans are never aligned
+        if self._steps is None:
+            normalizer = self.normalizer
+            steps = [Translation(_translation_table(normalizer.translation_src, normalizer.translation_dst))]
+            if normalizer._persian_style:
+                steps.extend(_pattern_steps(normalizer.persian_style_patterns))
+            if normalizer._persian_number:
+                steps.append(Translation(_translation_table(normalizer.number_translation_src,
+                                                            normalizer.number_translation_dst)))
+            if normalizer._remove_diacritics:
+                steps.extend(_pattern_steps(normalizer.diacritics_patterns))
+            if normalizer._correct_spacing:
+                steps.extend(_pattern_steps(normalizer.extra_space_patterns))
+                steps.append(TokenSpacing(normalizer))
+                steps.extend(_pattern_steps(normalizer.affix_spacing_patterns))
+                steps.extend(_pattern_steps(normalizer.punctuation_spacing_patterns))
+            if normalizer._unicodes_replacement:
+                steps.extend(_pattern_steps(normalizer.replacements))
+            if normalizer._remove_specials_chars:
+                steps.extend(_pattern_steps(normalizer.specials_chars_patterns))
+            # hazm replaces each word with `str.replace`, in turn
+            if normalizer._decrease_repeated_chars:
+                steps.append(Replacements(self.repeated_character_replacements))
+            if normalizer._seperate_mi:
+                steps.append(Replacements(self.joint_mi_replacements))
+            self._steps = steps
+        return self._steps
+
+    def repeated_character_replacements(self, text):
+        """The word replacements of ``Normalizer.decrease_repeated_chars``, in its order."""
+        normalizer = self.normalizer
+        words = normalizer.words
+        replacements = {}
+        for match in re.finditer(normalizer.repeated_chars_pattern, text):
+            word = match.group()
+            if word in words or word in replacements:
+                continue
+            no_repeat = re.sub(normalizer.more_than_two_repeat_pattern, r"\1", word)
+            two_repeat = re.sub(normalizer.more_than_two_repeat_pattern, r"\1\1", word)
+            if (no_repeat in words) != (two_repeat in words):
+                replacements[word] = no_repeat if no_repeat in words else two_repeat
+            else:
+                replacements[word] = two_repeat
+        return replacements.items()
+
+    def joint_mi_replacements(self, text):
+        """The word replacements of ``Normalizer.seperate_mi``, in its order."""
+        replacements = {}
+        for word in re.findall(self.normalizer.joint_mi_patterns, text):
+            separated = re.sub("^(ن?می)", "\\1\u200c", word)
+            if separated in self.normalizer.verbs:
+                replacements.setdefault(word, separated)
+        return replacements.items()
+
+    def align(self, text, offsets):
+        if not self.supported:
+            output = self.normalizer.normalize(text)
+            return output, offsets.compose(diff_edits(text, output), len(output))
+        for step in self.steps:
+            text, offsets = step.align(text, offsets)
+        return text, offsets
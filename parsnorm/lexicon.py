@@ -0,0 +1,142 @@
+"""
+Memory-mapped English to Persian lexicon
+========================================
+
+The CMU Pronouncing Dictionary is about 130k words stored as Python lists of
+phonemes, and every process that transliterates holds its own copy. This
+module precomputes the Persian transliteration of every entry once and stores
+it in a compact sorted file with a hash index. At runtime the file is
+memory-mapped and looked up in place, so all processes on a host share the
+same pages.
+
+Build the file once (by default into ``parsnorm/data/en_fa_lexicon.bin``)::
+
+    python -m parsnorm.lexicon
+
+File layout (little endian)::
+
+    magic b"PNLX" | version u32 | count u32 | slots u32 | fingerprint 16 bytes
+    offsets       (count + 1) x u32, relative to the start of the records
+    slots         slots x u32, open addressing on crc32(word); record index + 1, 0 if empty
+    records       count x (u16 word length | word | persian), sorted by word
+
+"""
+import os
+import sys
+import mmap
+import struct
+import zlib
+import hashlib
+
+MAGIC = b"PNLX"
+VERSION = 1
+HEADER = struct.Struct("<4sIII16s")
+OFFSET = struct.Struct("<I")
+WORD_LENGTH = struct.Struct("<H")
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data", "en_fa_lexicon.bin")
+
+
+def rules_fingerprint():
+    """
+    Digest of the transliteration rules and custom words. A lexicon built
+    with different rules is stale and is not used.
+    """
+    from parsnorm import en_fa_transliterate as rules
+    tables = (rules.custom_dict, rules.ARPABET_TO_PERSIAN, rules.START_DIACRITICS, rules.END_DIACRITICS,
+              rules.S_SPECIAL)
+    return hashlib.blake2b(repr(tables).encode("utf-8"), digest_size=16).digest()
+
+
+def build_lexicon(path=DEFAULT_LEXICON_PATH):
+    """
+    Transliterates the first pronunciation of every dictionary word and
+    writes the results to `path`. Returns the number of entries written.
+    """
+    from parsnorm.en_fa_transliterate import EnFaTransliterate, get_pronouncing_dict
+    transliterater = EnFaTransliterate(lexicon_path=False)
+    records = sorted((word.encode("utf-8"), transliterater.en_fa_transliterate(pronunciations[0]).encode("utf-8"))
+                     for word, pronunciations in get_pronouncing_dict().items())
+
+    offsets = [0]
+    for word, persian in records:
+        offsets.append(offsets[-1] + WORD_LENGTH.size + len(word) + len(persian))
+
+    # a power of two at least twice the entry count keeps probe chains short
+    n_slots = 1 << (2 * len(records)).bit_length()
+    slots = [0] * n_slots
+    for index, (word, _) in enumerate(records):
+        slot = zlib.crc32(word) & (n_slots - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (n_slots - 1)
+        slots[slot] = index + 1
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as lexicon:
+        lexicon.write(HEADER.pack(MAGIC, VERSION, len(records), n_slots, rules_fingerprint()))
+        lexicon.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        lexicon.write(struct.pack(f"<{n_slots}I", *slots))
+        for word, persian in records:
+            lexicon.write(WORD_LENGTH.pack(len(word)) + word + persian)
+    # readers that already mapped an older file keep their pages
+    os.replace(temporary_path, path)
+    return len(records)
+
+
+class MappedLexicon:
+    """
+    MappedLexicon
+    -------------
+    Read-only view of a lexicon file built by `build_lexicon`. Lookups hash
+    the word and probe the memory-mapped index; nothing is loaded into the
+    Python heap.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a lexicon or was built from different rules.
+    """
+    def __init__(self, path=DEFAULT_LEXICON_PATH):
+        self.path = path
+        with open(path, "rb") as lexicon:
+            self.buffer = mmap.mmap(lexicon.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, self.n_slots, fingerprint = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} transliteration lexicon")
+        if fingerprint != rules_fingerprint():
+            raise ValueError(f"{path} was built with different transliteration rules; rebuild it")
+        self.offsets_start = HEADER.size
+        self.slots_start = self.offsets_start + (self.count + 1) * OFFSET.size
+        self.records_start = self.slots_start + self.n_slots * OFFSET.size
+
+    def get(self, word, default=None):
+        key = word.encode("utf-8")
+        buffer = self.buffer
+        mask = self.n_slots - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            index, = OFFSET.unpack_from(buffer, self.slots_start + slot * OFFSET.size)
+            if not index:
+                return default
+            start, end = struct.unpack_from("<II", buffer, self.offsets_start + (index - 1) * OFFSET.size)
+            start += self.records_start
+            word_end = start + WORD_LENGTH.size + WORD_LENGTH.unpack_from(buffer, start)[0]
+            if buffer[start + WORD_LENGTH.size:word_end] == key:
+                return buffer[word_end:self.records_start + end].decode("utf-8")
+            slot = (slot + 1) & mask
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.buffer.close()
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LEXICON_PATH
+    print(f"wrote {build_lexicon(output)} entries to {output}")
@@ -0,0 +1,189 @@
+"""
+Parallel normalization helpers
+==============================
+
+Normalization is pure-Python regex and translate work, so a single process is
+bound to one core by the GIL. The helpers in this module spread texts over a
+pool of worker processes, each holding its own `ParsNorm` instance and a plan
+compiled once for the requested options.
+
+Starting workers is expensive, above all under the spawn start method where
+every worker imports hazm and builds its own `ParsNorm`, so pools are kept
+on the instance by worker count and option set and reused by later calls
+until `ParsNorm.close`.
+
+"""
+import os
+import json
+import itertools
+import collections
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Set in every worker process by `_init_worker`.
+_worker_plan = None
+# Set in every executor worker process by `_init_normalizer_worker`.
+_worker_normalizer = None
+
+
+def _init_worker(init_kwargs, options):
+    global _worker_plan
+    from parsnorm.parsnorm import ParsNorm
+    _worker_plan = ParsNorm(**init_kwargs).compile(**options)
+
+
+def _init_forked_worker(plan):
+    global _worker_plan
+    _worker_plan = plan
+
+
+def _init_normalizer_worker(init_kwargs, normalizer=None):
+    global _worker_normalizer
+    if normalizer is None:
+        from parsnorm.parsnorm import ParsNorm
+        normalizer = ParsNorm(**init_kwargs)
+    _worker_normalizer = normalizer
+
+
+def _normalize_with_options(text, options):
+    return _worker_normalizer.compile(**options)(text)
+
+
+def _normalize_text(text):
+    return _worker_plan(text)
+
+
+def _normalize_chunk(texts):
+    return [_worker_plan(text) for text in texts]
+
+
+def default_chunksize(n_texts, workers):
+    # same heuristic as multiprocessing.Pool.map: about four chunks per worker
+    chunksize, extra = divmod(n_texts, workers * 4)
+    return max(1, chunksize + bool(extra))
+
+
+def create_pool(normalizer, workers, options):
+    """
+    Starts a process pool whose workers each hold a `ParsNorm` configured
+    like `normalizer`, compiled for `options`.
+    """
+    if multiprocessing.get_start_method() == "fork":
+        # forked workers get their own copy of the already built plan for free
+        return multiprocessing.Pool(processes=workers, initializer=_init_forked_worker,
+                                    initargs=(normalizer.compile(**options),))
+    return multiprocessing.Pool(processes=workers, initializer=_init_worker,
+                                initargs=(normalizer.init_kwargs, options))
+
+
+def get_pool(normalizer, workers, options):
+    """
+    Returns the pool of `normalizer` for `workers` processes and `options`,
+    starting it on first use.
+    """
+    key = (workers, tuple(sorted(options.items())))
+    pool = normalizer._pools.get(key)
+    if pool is None:
+        pool = normalizer._pools[key] = create_pool(normalizer, workers, options)
+    return pool
+
+
+def close_pools(normalizer):
+    """Stops the pools of `normalizer`."""
+    pools, normalizer._pools = normalizer._pools, {}
+    for pool in pools.values():
+        pool.terminate()
+        pool.join()
+
+
+def create_executor(normalizer, workers):
+    """
+    Starts a `ProcessPoolExecutor` whose workers each hold a `ParsNorm`
+    configured like `normalizer`, for use with `_normalize_with_options`.
+    """
+    if multiprocessing.get_start_method() == "fork":
+        initargs = (normalizer.init_kwargs, normalizer)
+    else:
+        initargs = (normalizer.init_kwargs,)
+    return ProcessPoolExecutor(workers, initializer=_init_normalizer_worker, initargs=initargs)
+
+
+def normalize_batch(normalizer, texts, workers=None, chunksize=None, **options):
+    """
+    Normalizes `texts` over `workers` processes and returns the results in
+    input order. See `ParsNorm.normalize_batch`.
+    """
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    plan = normalizer.compile(**options)
+    if workers == 1 or len(texts) <= 1:
+        return [plan(text) for text in texts]
+    chunksize = chunksize or default_chunksize(len(texts), workers)
+    return get_pool(normalizer, workers, plan.options).map(_normalize_text, texts, chunksize)
+
+
+def _iter_lines(source):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as lines:
+            for line in lines:
+                yield line.rstrip("\n")
+    else:
+        yield from source
+
+
+def _iter_chunks(source, field, chunksize):
+    """
+    Yields ``(records, texts)`` pairs of at most `chunksize` items. For JSONL
+    input `records` holds the decoded objects the texts were taken from, and
+    None for every blank line, which has no text.
+    """
+    lines = _iter_lines(source)
+    while True:
+        chunk = list(itertools.islice(lines, chunksize))
+        if not chunk:
+            return
+        if field is None:
+            yield None, chunk
+        else:
+            records = [line if not isinstance(line, str) else json.loads(line) if line.strip() else None
+                       for line in chunk]
+            yield records, [record[field] for record in records if record is not None]
+
+
+def _merge(records, texts, field):
+    if records is None:
+        return texts
+    texts = iter(texts)
+    for record in records:
+        if record is not None:
+            record[field] = next(texts)
+    return records
+
+
+def normalize_stream(normalizer, source, workers=None, chunksize=256, max_pending=None, field=None, **options):
+    """
+    Lazily normalizes `source` chunk by chunk over `workers` processes,
+    keeping at most `max_pending` chunks in flight. See
+    `ParsNorm.normalize_stream`.
+    """
+    workers = workers or os.cpu_count() or 1
+    plan = normalizer.compile(**options)
+    chunks = _iter_chunks(source, field, chunksize)
+    if workers == 1:
+        for records, texts in chunks:
+            yield from _merge(records, [plan(text) for text in texts], field)
+        return
+
+    max_pending = max_pending or 2 * workers
+    pending = collections.deque()
+    pool = get_pool(normalizer, workers, plan.options)
+    for records, texts in chunks:
+        # reading blocks here once `max_pending` chunks are queued, so memory
+        # stays bounded however large the source is
+        if len(pending) >= max_pending:
+            done_records, result = pending.popleft()
+            yield from _merge(done_records, result.get(), field)
+        pending.append((records, pool.apply_async(_normalize_chunk, (texts,))))
+    while pending:
+        done_records, result = pending.popleft()
+        yield from _merge(done_records, result.get(), field)
@@ -16,15 +16,27 @@ ParsNorm
     A class that integrates normalization functionalities from `hazm`, ``,
     `parsinorm`, and `english_to_persian_transliteration` to provide advanced
     text processing capabilities.
+NormalizationPlan
+    A callable pipeline returned by `ParsNorm.compile` with the enabled stages
+    resolved once for a fixed set of options.
 
 """
 import re
+import time
 import string
-from num2words import num2words as words
-from hazm import Normalizer as HazmNormalizer
-from parsinorm import Mail_url_cleaner, Date_time_to_text, Abbreviation, Special_numbers
+import functools
+from parsinorm import Mail_url_cleaner, Date_time_to_text, Abbreviation, Special_numbers, Telephone_number
 from parsinorm import General_normalization as ParsiNormalizer
+from parsinorm import Template_selector
+from parsinorm.character_filter import Character_filter
+from parsinorm.number_words import cardinal_words
 from parsnorm.en_fa_transliterate import EnFaTransliterate
+from parsnorm import parallel
+from parsnorm.aio import AsyncNormalizer
+import parsnorm
+from parsnorm.cache import ResultCache, DiskCache, ChainedCache, rules_fingerprint
+from parsnorm.alignment import OffsetMap, Substitution, Translation, Chain, Passes, Characterwise, align
+from parsnorm.hazm_alignment import HazmNormalization
 
 SYMBOLS_PRONUNCIATION = {
     "%": " درصد",
@@ -36,6 +48,123 @@ SYMBOLS_PRONUNCIATION = {
     "°C": " درجه سلسیوس",
     "°F": " درجه فارنهایت"
 }
+SYMBOLS_PRONUNCIATION_PATTERN = re.compile('|'.join(map(re.escape, SYMBOLS_PRONUNCIATION)))
+MULTIPLE_SPACES_PATTERN = re.compile(" +")
+SPACE_CLEANUP = Substitution(MULTIPLE_SPACES_PATTERN, " ")
+ENGLISH_WORD_PATTERN = re.compile(r"\b[a-zA-Z]+(?:'[a-zA-Z]+)?\b")
+
+# Options accepted by `ParsNorm.normalize` and `ParsNorm.compile`, with their defaults.
+NORMALIZE_DEFAULTS = {
+    "convert_time": True,
+    "convert_date": False,
+    "alphabet_correction": True,
+    "semi_space_correction": True,
+    "english_correction": False,
+    "arabic_correction": True,
+    "punctuation_correction": True,
+    "special_chars_removal": True,
+    "comma_between_numbers_removal": True,
+    "number_correction": True,
+    "repeated_punctuation_removal": True,
+    "date_abbrev_replacement": True,
+    "persian_label_abbrev_replacement": True,
+    "law_abbrev_replacement": True,
+    "book_abbrev_replacement": True,
+    "other_abbrev_replacement": True,
+    "phone_conversion": False,
+    "number_conversion": True,
+    "en_fa_transliteration": True,
+    "symbol_pronounciation": True,
+    "hazm": True,
+    "remove_punct": True,
+    "keep_allowed_chars": True,
+}
+
+
+class NormalizationPlan:
+    """
+    NormalizationPlan
+    -----------------
+    A normalization pipeline resolved for one fixed set of options. Plans are
+    created with `ParsNorm.compile` and only run the stages that are enabled,
+    in the same order as `ParsNorm.normalize`.
+
+    Attributes
+    ----------
+    options : dict
+        The complete option set (defaults included) the plan was compiled for.
+    stages : tuple of (str, callable)
+        The enabled stages as ``(name, function)`` pairs, in execution order.
+    profiler : StageProfiler or None
+        Receives the timing and lengths of every stage when set.
+    cache : ResultCache, DiskCache, ChainedCache or None
+        Results of earlier calls, shared by the plans of one `ParsNorm` and
+        told apart by `options`.
+    """
+    def __init__(self, stages, options, profiler=None, cache=None):
+        self.stages = tuple(stages)
+        self.options = options
+        self.profiler = profiler
+        self.cache = cache
+        # the enabled options as the bits of one int, a cheap part of cache keys
+        self.options_key = sum(1 << bit for bit, name in enumerate(NORMALIZE_DEFAULTS) if options[name])
+
+    @property
+    def stage_names(self):
+        return [name for name, _ in self.stages]
+
+    def __call__(self, text):
+        if self.cache is None:
+            return self._normalize(text)
+        key = (self.options_key, text)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._normalize(text)
+            self.cache.put(key, result)
+        return result
+
+    def _normalize(self, text):
+        if self.profiler is not None:
+            return self._profiled_call(text)
+        for _, stage in self.stages:
+            text = stage(text)
+        return MULTIPLE_SPACES_PATTERN.sub(" ", text).strip()
+
+    def _profiled_call(self, text):
+        record = self.profiler.record
+        clock = time.perf_counter
+        for name, stage in self.stages:
+            start = clock()
+            result = stage(text)
+            record(name, clock() - start, len(text), len(result))
+            text = result
+        start = clock()
+        result = MULTIPLE_SPACES_PATTERN.sub(" ", text).strip()
+        record("space_cleanup", clock() - start, len(text), len(result))
+        return result
+
+    def with_offsets(self, text):
+        """
+        Normalizes `text` like calling the plan and also returns an
+        `OffsetMap` from the normalized text back to `text`.
+        """
+        offsets = OffsetMap(len(text))
+        for _, stage in self.stages:
+            text, offsets = align(stage, text, offsets)
+        text, offsets = align(SPACE_CLEANUP, text, offsets)
+        stripped = text.strip()
+        if len(stripped) != len(text):
+            leading = len(text) - len(text.lstrip())
+            trailing = len(text) - len(text.rstrip())
+            edits = [(0, leading, 0)] if leading else []
+            if trailing and leading < len(text):
+                edits.append((len(text) - trailing, len(text), 0))
+            offsets = offsets.compose(edits, len(stripped))
+        return stripped, offsets
+
+    def __repr__(self):
+        return f"NormalizationPlan({', '.join(self.stage_names)})"
+
 
 class ParsNorm:
     """
@@ -46,26 +175,89 @@ class ParsNorm:
 
     Methods
     -------
-    __init__()
+    __init__(allowed_puncts, remove_diacritics=True, transliteration_cache_size=65536, profiler=None,
+             template_policy="random", template_seed=0, result_cache_size=0, result_cache_bytes=None,
+             disk_cache=None)
         Initializes the ParsNorm instance with required sub-modules.
+        `transliteration_cache_size` bounds the per-word transliteration
+        cache; None makes it unbounded and 0 disables it. A `StageProfiler`
+        passed as `profiler` collects per-stage statistics of every plan.
+        `template_policy` decides how one of several equivalent readings of
+        a date, time or number is picked: "random" (the global random
+        module), "fixed", "seed" (an own generator seeded with
+        `template_seed`) or "hash" (a function of the value and
+        `template_seed`, so outputs depend only on the text and options).
+        `result_cache_size` enables an LRU cache of that many normalized
+        texts, optionally bounded to `result_cache_bytes` as well; like
+        `disk_cache`, it raises ValueError with the "random" policy.
+        `disk_cache` is the path of an SQLite database that keeps results
+        across runs and is shared by worker processes; results are only
+        reused by the same library version, rules and configuration.
 
     en_fa_transliterate(text)
         Transliterates English words in the input text to Persian equivalents.
 
+    transliteration_cache_info()
+        Returns hit and miss statistics of the per-word transliteration cache.
+
     normalize(text, **kwargs)
         Performs normalization on the given text based on provided options.
 
+    compile(**kwargs)
+        Returns a reusable `NormalizationPlan` for the given options.
+
+    normalize_batch(texts, workers=None, chunksize=None, **kwargs)
+        Normalizes many texts in parallel worker processes.
+
+    normalize_stream(source, workers=None, chunksize=256, **kwargs)
+        Lazily normalizes a file or iterable of texts in constant memory.
+
+    anormalize(text, **kwargs), anormalize_many(texts, **kwargs)
+        Coroutines that normalize in an executor with bounded concurrency.
+
+    normalize_with_offsets(text, **kwargs)
+        Normalizes and maps the result back to spans of the input.
+
+    cache_info(), cache_clear()
+        Report on and empty the result cache.
+
+    close()
+        Stops the worker processes kept for parallel normalization; also
+        called when the instance is used as a context manager.
+
     """
-    def __init__(self, allowed_puncts='!(),-.:;? ̠،؛؟‌<>«»', remove_diacritics=True):
-        self.hazm_norm = HazmNormalizer(remove_diacritics=remove_diacritics)
+    def __init__(self, allowed_puncts='!(),-.:;? ̠،؛؟‌<>«»', remove_diacritics=True,
+                 transliteration_cache_size=65536, profiler=None, template_policy="random", template_seed=0,
+                 result_cache_size=0, result_cache_bytes=None, disk_cache=None):
+        if template_policy == "random":
+            if disk_cache is not None:
+                raise ValueError("disk_cache needs a reproducible template_policy such as 'hash'; "
+                                 "with 'random' it would store one random reading of every text")
+            if result_cache_size:
+                raise ValueError("result_cache_size needs a reproducible template_policy such as 'hash'; "
+                                 "with 'random' every repeat would get the first random reading")
+        # kept so that worker processes can build an identically configured instance
+        self.init_kwargs = {"allowed_puncts": allowed_puncts, "remove_diacritics": remove_diacritics,
+                            "transliteration_cache_size": transliteration_cache_size,
+                            "template_policy": template_policy, "template_seed": template_seed,
+                            "result_cache_size": result_cache_size, "result_cache_bytes": result_cache_bytes,
+                            "disk_cache": disk_cache}
+        self.remove_diacritics = remove_diacritics
+        self._hazm_norm = None
 
         self.parsi_norm = ParsiNormalizer()
         self.mail_url_cleaner = Mail_url_cleaner()
-        self.date_time_to_text = Date_time_to_text()
+        self.template_selector = Template_selector(template_policy, template_seed)
+        self.date_time_to_text = Date_time_to_text(self.template_selector)
         self.abbreviation = Abbreviation()
-        self.special_numbers = Special_numbers()
+        self.special_numbers = Special_numbers(self.template_selector)
+        self.telephone_number = Telephone_number(self.template_selector)
 
         self.en_fa_transliterater = EnFaTransliterate()
+        # English words in a corpus are heavily repeated, so the same few
+        # thousand words account for most calls to the word normalizer
+        self.transliterate_word = functools.lru_cache(maxsize=transliteration_cache_size)(
+            self.en_fa_transliterater.normalizer)
         self.num_pattern = r'\b\d+(\.\d+)?\b'
 
         self.allowed_puncts = allowed_puncts
@@ -75,18 +267,100 @@ class ParsNorm:
         # add space and half-space \u200c and newline
         self.allowed_chars += " \u200c\n"
         self.allowed_chars_regex = f"[^{self.allowed_chars}]"
+        self.num_regex = re.compile(self.num_pattern)
+
+        # every stage is built from `Substitution`s, `Translation`s and other
+        # aligned steps, so that it reports its edits to `normalize_with_offsets`
+        self.symbol_pronouncer = Substitution(SYMBOLS_PRONUNCIATION_PATTERN,
+                                              lambda match: SYMBOLS_PRONUNCIATION[match.group(0)])
+        # the steps of `Special_numbers.convert_numbers_to_text` after the
+        # cardinal reading of plain numbers
+        self.number_converter = Chain(Substitution(self.num_regex, lambda match: cardinal_words(match.group(0))),
+                                      Translation(self.special_numbers.general_normalization.number_table),
+                                      Substitution(self.special_numbers.number_scanner_for,
+                                                   self.special_numbers.number_to_text))
+        self.word_transliterater = Substitution(ENGLISH_WORD_PATTERN,
+                                                lambda match: self.transliterate_word(match.group(0).lower()))
 
         self.substitution_dict = {'ﯽ': 'ی', '—': '–', '\u200f': '\u200c', '\xad': '\u200c', '\u200e': '\u200c', '\u200d': '\u200c'}
         self.translation_table = str.maketrans(self.substitution_dict)
+        # `allowed_puncts` is taken as regex class syntax, as it always was
+        self.allowed_chars_filter = Character_filter(self.allowed_chars, substitutions=self.substitution_dict)
+        self.allowed_chars_puncts_filter = Character_filter(self.allowed_chars + self.allowed_puncts,
+                                                            substitutions=self.substitution_dict)
+        self.allowed_chars_pattern = self.allowed_chars_filter.pattern
+        self.allowed_chars_puncts_pattern = self.allowed_chars_puncts_filter.pattern
 
+        self._plans = {}
+        self._profiler = profiler
+        caches = []
+        if result_cache_size:
+            caches.append(ResultCache(result_cache_size, result_cache_bytes))
+        if disk_cache is not None:
+            caches.append(DiskCache(disk_cache, self._cache_namespace()))
+        self.result_cache = caches[0] if len(caches) == 1 else ChainedCache(*caches) if caches else None
+        self._async_normalizer = None
+        # worker pools of `normalize_batch` and `normalize_stream`, see `parallel.get_pool`
+        self._pools = {}
+
+    def close(self):
+        """
+        Stops the worker processes kept by `normalize_batch`,
+        `normalize_stream` and the async normalizer. The instance stays
+        usable and starts new workers when it needs them.
+        """
+        parallel.close_pools(self)
+        if self._async_normalizer is not None:
+            self._async_normalizer.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        # plans take the profiler when they are compiled, so compile afresh
+        self._profiler = profiler
+        self._plans = {}
+
+    @property
+    def async_normalizer(self):
+        # a thread pool by default; assign an `AsyncNormalizer` to choose
+        # processes, the pool size or the concurrency limit
+        if self._async_normalizer is None:
+            self._async_normalizer = AsyncNormalizer(self)
+        return self._async_normalizer
+
+    @async_normalizer.setter
+    def async_normalizer(self, async_normalizer):
+        self._async_normalizer = async_normalizer
+
+    @property
+    def hazm_norm(self):
+        # hazm is slow to import and its Normalizer slow to build, so both wait for first use
+        if self._hazm_norm is None:
+            from hazm import Normalizer as HazmNormalizer
+            self._hazm_norm = HazmNormalizer(remove_diacritics=self.remove_diacritics)
+        return self._hazm_norm
 
     def substitute_symbols(self, text):
-        substituted_text = text.translate(self.translation_table)
-        return substituted_text
+        return self.allowed_chars_filter.substitute(text)
     
     def keep_allowed_chars(self, text, allowed_chars_regex):
         return re.sub(allowed_chars_regex, ' ', text)
-    
+
+    def pronounce_symbols(self, text):
+        return self.symbol_pronouncer(text)
+
+    def convert_numbers(self, text):
+        return self.number_converter(text)
+
     def en_fa_transliterate(self, text):
         """
         Transliterates English words in the input text to Persian equivalents.
@@ -102,7 +376,35 @@ class ParsNorm:
         str
             Text with English words transliterated to Persian.
         """
-        return re.sub(r"\b[a-zA-Z]+(?:'[a-zA-Z]+)?\b", lambda match: self.en_fa_transliterater.normalizer(match.group(0).lower()), text)
+        return self.word_transliterater(text)
+
+    def _cache_namespace(self):
+        # everything a stored result depends on besides the text and options
+        config = {name: value for name, value in self.init_kwargs.items()
+                  if name not in ("result_cache_size", "result_cache_bytes", "disk_cache")}
+        return parsnorm.__version__.encode("utf-8") + rules_fingerprint() + repr(sorted(config.items())).encode("utf-8")
+
+    def cache_info(self):
+        """
+        Returns the statistics of the result cache: hits, misses, hit_rate,
+        entries, maxsize, bytes and max_bytes. With both an in-memory and a
+        disk cache, overall hits, misses and hit_rate and the statistics of
+        each under ``levels``. None if it is disabled.
+        """
+        return None if self.result_cache is None else self.result_cache.info()
+
+    def cache_clear(self):
+        """Empties the result cache and resets its statistics."""
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    def transliteration_cache_info(self):
+        """
+        Returns the statistics of the per-word transliteration cache as a
+        named tuple of ``hits``, ``misses``, ``maxsize`` and ``currsize``.
+        Call ``transliterate_word.cache_clear()`` to empty it.
+        """
+        return self.transliterate_word.cache_info()
     
     def normalize(self, text,
                   convert_time=True, convert_date=False,
@@ -114,7 +416,7 @@ class ParsNorm:
                   repeated_punctuation_removal=True,
                   date_abbrev_replacement=True, persian_label_abbrev_replacement=True,
                   law_abbrev_replacement=True, book_abbrev_replacement=True, 
-                  other_abbrev_replacement=True,
+                  other_abbrev_replacement=True, phone_conversion=False,
                   number_conversion=True, en_fa_transliteration=True,
                   symbol_pronounciation=True,
                   hazm=True, remove_punct=True, keep_allowed_chars=True):
@@ -158,6 +460,9 @@ class ParsNorm:
             If True, replaces book abbreviations. Default is True.
         other_abbrev_replacement : bool, optional
             If True, replaces other abbreviations. Default is True.
+        phone_conversion : bool, optional
+            If True, reads phone numbers digit group by digit group, as they
+            are spoken, before the other numbers are converted. Default is False.
         number_conversion : bool, optional
             If True, converts numbers to textual form. Default is True.
         en_fa_transliteration : bool, optional
@@ -173,64 +478,216 @@ class ParsNorm:
         str
             The normalized text.
         """
-        if convert_time:
-            text = self.date_time_to_text.time_to_text(text)
-        if convert_date:
-            text = self.date_time_to_text.date_to_text(text)
-
-        if repeated_punctuation_removal:
-            text = self.parsi_norm.remove_repeated_punctuation(text)
-        if symbol_pronounciation:
-            for symbol, pronunciation in SYMBOLS_PRONUNCIATION.items():
-                text = text.replace(symbol, pronunciation)
-
-        if alphabet_correction:
-            text = self.parsi_norm.alphabet_correction(text)
-        if semi_space_correction:
-            text = self.parsi_norm.semi_space_correction(text)
-        if english_correction:
-            text = self.parsi_norm.english_correction(text)
-        if arabic_correction:
-            text = self.parsi_norm.arabic_correction(text)
-        if punctuation_correction:
-            text = self.parsi_norm.punctuation_correction(text)
-        if special_chars_removal:
-            text = self.parsi_norm.specials_chars(text)
-        if comma_between_numbers_removal:
-            text = self.parsi_norm.remove_comma_between_numbers(text)
-        if number_correction:
-            text = self.parsi_norm.number_correction(text)
-
-        if date_abbrev_replacement:
-            text = self.abbreviation.replace_date_abbreviation(text)
-        if persian_label_abbrev_replacement:
-            text = self.abbreviation.replace_persian_label_abbreviation(text)
-        if law_abbrev_replacement:
-            text = self.abbreviation.replace_law_abbreviation(text)
-        if book_abbrev_replacement:
-            text = self.abbreviation.replace_book_abbreviation(text)
-        if other_abbrev_replacement:
-            text = self.abbreviation.replace_other_abbreviation(text)
-
-        if number_conversion:
-            text = re.sub(self.num_pattern, lambda match: words(float(match.group(0)), lang='fa'), text)
-            text = self.special_numbers.convert_numbers_to_text(text)
-
-        if en_fa_transliteration:
-            text = self.en_fa_transliterate(text)
-        
-        if hazm:
-            text = self.hazm_norm.normalize(text)
-
-        if not remove_punct:
-            temp_allowed_chars = self.allowed_chars + self.allowed_puncts
-            temp_allowed_chars_regex = f"[^{temp_allowed_chars}]"
-        else:
-            temp_allowed_chars = self.allowed_chars
-            temp_allowed_chars_regex = self.allowed_chars_regex
-        if keep_allowed_chars:
-            text = self.substitute_symbols(text)
-            text = self.keep_allowed_chars(text, temp_allowed_chars_regex)
-
-        text = re.sub(" +", " ", text).strip()
-        return text
\ No newline at end of file
+        options = dict(locals())
+        del options["self"], options["text"]
+        return self.compile(**options)(text)
+
+    def compile(self, **options):
+        """
+        Resolves a set of normalization options into a reusable plan. Options
+        that are not given take the defaults of `normalize`. Plans are cached
+        per option set, so compiling the same options again is cheap.
+
+        Parameters
+        ----------
+        **options : bool
+            Any of the keyword options accepted by `normalize`.
+
+        Returns
+        -------
+        NormalizationPlan
+            A callable that normalizes a single text with the given options.
+        """
+        unknown = set(options) - set(NORMALIZE_DEFAULTS)
+        if unknown:
+            raise TypeError(f"compile() got an unexpected keyword argument '{sorted(unknown)[0]}'")
+        options = {**NORMALIZE_DEFAULTS, **options}
+        key = tuple(bool(options[name]) for name in NORMALIZE_DEFAULTS)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = NormalizationPlan(self._build_stages(options), options, self._profiler, self.result_cache)
+            self._plans[key] = plan
+        return plan
+
+    def normalize_batch(self, texts, workers=None, chunksize=None, **options):
+        """
+        Normalizes many texts in parallel. Texts are spread over a pool of
+        worker processes, each holding its own `ParsNorm` configured like this
+        instance, so throughput scales with the number of cores. The pool is
+        kept for later calls with the same options and workers until
+        `close`.
+
+        Parameters
+        ----------
+        texts : iterable of str
+            The texts to normalize.
+        workers : int, optional
+            Number of worker processes. Default is the number of CPUs. With
+            1 worker the texts are normalized in the calling process.
+        chunksize : int, optional
+            Number of texts sent to a worker at a time. Default is about four
+            chunks per worker.
+        **options : bool
+            Any of the keyword options accepted by `normalize`.
+
+        Returns
+        -------
+        list of str
+            The normalized texts, in input order.
+        """
+        return parallel.normalize_batch(self, texts, workers=workers, chunksize=chunksize, **options)
+
+    def normalize_stream(self, source, workers=None, chunksize=256, max_pending=None, field=None, **options):
+        """
+        Lazily normalizes a corpus line by line. Chunks of lines are
+        normalized in worker processes while the next ones are read, and at
+        most `max_pending` chunks are in flight at any time, so memory stays
+        constant regardless of the corpus size. Workers are shared with
+        `normalize_batch` and kept until `close`.
+
+        Parameters
+        ----------
+        source : str, os.PathLike or iterable
+            A path to a UTF-8 text or JSONL file, or an iterable of texts (or
+            of JSON lines / dicts when `field` is given).
+        workers : int, optional
+            Number of worker processes. Default is the number of CPUs. With
+            1 worker the texts are normalized in the calling process.
+        chunksize : int, optional
+            Number of lines sent to a worker at a time. Default is 256.
+        max_pending : int, optional
+            Maximum number of chunks being normalized at once. Default is
+            twice the number of workers.
+        field : str, optional
+            If given, the input is read as JSONL and the text in `field` of
+            every record is normalized in place. A blank line yields None,
+            so results stay line for line with the input.
+        **options : bool
+            Any of the keyword options accepted by `normalize`.
+
+        Yields
+        ------
+        str, dict or None
+            The normalized texts, or the updated records for JSONL input, in
+            input order.
+        """
+        return parallel.normalize_stream(self, source, workers=workers, chunksize=chunksize,
+                                         max_pending=max_pending, field=field, **options)
+
+    def normalize_with_offsets(self, text, **options):
+        """
+        Normalizes `text` like `normalize` and also returns where every
+        character of the result came from in `text`. Every stage reports its
+        replacements as it runs, hazm included, so this costs about as much
+        as a few more `normalize` calls.
+
+        Parameters
+        ----------
+        text : str
+            The text to normalize.
+        **options : bool
+            Any of the keyword options accepted by `normalize`.
+
+        Returns
+        -------
+        tuple of (str, OffsetMap)
+            The normalized text and its map to `text`; ``offsets.span(i, j)``
+            is the span of `text` that produced ``normalized[i:j]``.
+        """
+        return self.compile(**options).with_offsets(text)
+
+    async def anormalize(self, text, **options):
+        """
+        Normalizes `text` without blocking the event loop. The work runs in
+        the executor of `async_normalizer`, which also limits how many texts
+        are normalized at once.
+
+        Parameters
+        ----------
+        text : str
+            The text to normalize.
+        **options : bool
+            Any of the keyword options accepted by `normalize`.
+
+        Returns
+        -------
+        str
+            The normalized text.
+        """
+        return await self.async_normalizer.normalize(text, **options)
+
+    async def anormalize_many(self, texts, **options):
+        """
+        Normalizes `texts` concurrently without blocking the event loop and
+        returns the results in input order. Cancelling the call cancels the
+        texts that have not started yet.
+        """
+        return await self.async_normalizer.normalize_many(texts, **options)
+
+    def _build_stages(self, options):
+        stages = []
+        if options["convert_time"]:
+            stages.append(("convert_time", Substitution(
+                self.date_time_to_text.time_pattern, self.date_time_to_text.time_match_to_text)))
+        if options["convert_date"]:
+            stages.append(("convert_date", Chain(
+                Substitution(self.date_time_to_text.date_pattern, self.date_time_to_text.date_match_to_text),
+                Translation(self.date_time_to_text.number_table))))
+
+        if options["repeated_punctuation_removal"]:
+            stages.append(("repeated_punctuation_removal", Substitution(
+                self.parsi_norm.repeated_punctuation_pattern, lambda match: match.group(1))))
+        if options["symbol_pronounciation"]:
+            stages.append(("symbol_pronounciation", self.symbol_pronouncer))
+
+        # The single character corrections are fused into one translate pass.
+        # Semi-space correction touches none of their characters, so it can
+        # run after them, and the comma removal then sees corrected digits.
+        character_table = self.parsi_norm.fused_table(
+            alphabet=options["alphabet_correction"],
+            english=options["english_correction"],
+            arabic=options["arabic_correction"],
+            punctuation=options["punctuation_correction"],
+            specials=options["special_chars_removal"],
+            number=options["number_correction"] or options["comma_between_numbers_removal"])
+        if character_table:
+            stages.append(("character_correction", Translation(character_table)))
+        if options["semi_space_correction"]:
+            stages.append(("semi_space_correction", Substitution(
+                self.parsi_norm.semi_space_pattern, lambda match: self.parsi_norm.semi_space[match.group()])))
+        if options["comma_between_numbers_removal"]:
+            stages.append(("comma_between_numbers_removal", Substitution(self.parsi_norm.digit_separator_pattern, "")))
+
+        abbreviation_tables = {
+            "date": options["date_abbrev_replacement"],
+            "persian_label": options["persian_label_abbrev_replacement"],
+            "law": options["law_abbrev_replacement"],
+            "book": options["book_abbrev_replacement"],
+            "other": options["other_abbrev_replacement"],
+        }
+        if any(abbreviation_tables.values()):
+            stages.append(("abbreviation_replacement", Passes([
+                (abbreviation, Substitution(pattern, replace))
+                for abbreviation, pattern, replace in self.abbreviation.replacer(**abbreviation_tables)])))
+
+        if options["phone_conversion"]:
+            # expects digits already converted by the character correction
+            stages.append(("phone_conversion", Substitution(
+                self.telephone_number.phone_pattern, self.telephone_number.phone_to_text)))
+        if options["number_conversion"]:
+            stages.append(("number_conversion", self.number_converter))
+
+        if options["en_fa_transliteration"]:
+            stages.append(("en_fa_transliteration", self.word_transliterater))
+
+        if options["hazm"]:
+            stages.append(("hazm", HazmNormalization(self.hazm_norm)))
+
+        if options["keep_allowed_chars"]:
+            if options["remove_punct"]:
+                allowed_chars_filter = self.allowed_chars_filter
+            else:
+                allowed_chars_filter = self.allowed_chars_puncts_filter
+            # every character is kept or replaced by one space, so offsets hold
+            stages.append(("keep_allowed_chars", Characterwise(allowed_chars_filter)))
+        return stages
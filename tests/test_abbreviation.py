@@ -0,0 +1,58 @@
+import pytest
+
+from parsinorm.abbreviation import Abbreviation
+from parsnorm import ParsNorm
+
+
+@pytest.fixture(scope="module")
+def abbreviation():
+    return Abbreviation()
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return ParsNorm(template_policy="fixed")
+
+
+@pytest.mark.parametrize("text, expected", [
+    # shorter keys of earlier tables and earlier entries still come first
+    ("ق.م.ف.", "قبل از میلاد.ف."),
+    ("ق.ا.ا.م", "قانون اساسی.ا.م"),
+    ("ن.ک.ص", "نگاه کنید.ص"),
+    ("ق.م. دیگر", "قبل از میلاد. دیگر"),
+    ("سال ۱۴۰۲ ه.ش. است", "سال ۱۴۰۲ هجری شمسی است"),
+    ("سال ۵۰۰ ق.م.", "سال ۵۰۰ قبل از میلاد."),
+    ("دولت ج.ا.ا.", "دولت جمهوری اسلامی ایران."),
+])
+def test_priority_order(abbreviation, text, expected):
+    assert abbreviation.replace_abbreviations(text) == expected
+
+
+def test_later_tables_apply_when_earlier_ones_are_disabled(abbreviation):
+    assert abbreviation.replace_abbreviations("ق.م.ف.", date=False) == "قانون مدنی.ف."
+    assert abbreviation.replace_law_abbreviation("ق.م") == "قانون مدنی"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("سال ۱۴۰۲ ه.ش.", "سال ۱۴۰۲ هجری شمسی."),
+    ("سال ۱۴۰۲ ه.ش. \n", "سال ۱۴۰۲ هجری شمسی. \n"),
+    ("تولد در ۴۵۰ ه.ق.", "تولد در ۴۵۰ هجری قمری."),
+    # inside a sentence the dot belongs to the abbreviation only
+    ("سال ۱۴۰۲ ه.ش. است", "سال ۱۴۰۲ هجری شمسی است"),
+])
+def test_sentence_final_dot_is_kept(abbreviation, normalizer, text, expected):
+    assert abbreviation.replace_abbreviations(text) == expected
+    assert normalizer.normalize(text, remove_punct=False).endswith(".") == expected.rstrip().endswith(".")
+
+
+@pytest.mark.parametrize("text, expected, expected_with_punctuation", [
+    ("ق.م.ف.", "قبل از میلاد ف", "قبل از میلاد. ف."),
+    ("ق.ا.ا.م", "قانون اساسی ا م", "قانون اساسی. ا. م"),
+    ("ن.ک.ص", "نگاه کنید ص", "نگاه کنید. ص"),
+    ("سال ۵۰۰ ق.م.", "سال پانصد قبل از میلاد", "سال پانصد قبل از میلاد."),
+    ("دولت ج.ا.ا.", "دولت جمهوری اسلامی ایران", "دولت جمهوری اسلامی ایران."),
+])
+def test_pipeline(normalizer, text, expected, expected_with_punctuation):
+    assert normalizer.normalize(text) == expected
+    assert normalizer.normalize(text, remove_punct=False) == expected_with_punctuation
+    assert normalizer.normalize_with_offsets(text, remove_punct=False)[0] == expected_with_punctuation
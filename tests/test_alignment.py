@@ -0,0 +1,178 @@
+import random
+import re
+
+import pytest
+
+from benchmarks.corpus import generate_corpus
+from parsnorm import ParsNorm
+from parsnorm import alignment
+from parsnorm import hazm_alignment
+from parsnorm.alignment import OffsetMap, Substitution
+from parsnorm.parsnorm import NORMALIZE_DEFAULTS
+
+
+TEXTS = [
+    "",
+    "سلام instagram ۱۲ کتاب",
+    "ساعت 12:30 ﷲ  و  ق.م.ف.   دیگر",
+    "  iPhone 2.5 درصد!!! ",
+    "تاریخ ۱۴۰۲/۰۵/۱۲ و ۱۳۹۹-۱-۲ ساعت ۸:۳۰:۱۵ ۱٬۲۳۴٬۵۶۷ تومان",
+    "نمیدانم چه میگفت\tو  «  این » سلامممممم کتاب ها\n\nزمین لرزه ای",
+    "شماره ۰۲۱-۸۸۸۸۸۸۸۸ و +۹۸۹۱۲۱۲۳۴۵۶۷ صفحه ۱۲-۱۵ و ۳.۱۴ ...",
+]
+
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return ParsNorm(template_policy="fixed")
+
+
+def test_built_in_stages_report_their_edits(normalizer, monkeypatch):
+    def diff_edits(source, output):
+        raise AssertionError("a built-in stage was aligned by diffing")
+
+    monkeypatch.setattr(alignment, "diff_edits", diff_edits)
+    options = {name: True for name, value in NORMALIZE_DEFAULTS.items() if isinstance(value, bool)}
+    for text in TEXTS:
+        output, offsets = normalizer.normalize_with_offsets(text, **options)
+        assert output == normalizer.normalize(text, **options)
+        assert len(offsets) == len(output)
+
+
+def random_edits(generator, length):
+    """Sorted, non-overlapping edits of a text of `length` characters."""
+    edits, position = [], 0
+    while position <= length and generator.random() < 0.8:
+        start = generator.randint(position, min(length, position + 4))
+        end = generator.randint(start, min(length, start + 3))
+        replacement_length = generator.randint(0, 3)
+        if (end, replacement_length) == (start, 0):
+            position = start + 1
+            continue
+        edits.append((start, end, replacement_length))
+        position = end + 1 if end == start else end
+    return edits
+
+
+def apply_edits(spans, edits, source_length):
+    """The per character spans `compose` should give, built directly."""
+    def source_start(position):
+        return spans[position][0] if position < len(spans) else source_length
+
+    result, position = [], 0
+    for start, end, replacement_length in edits:
+        result.extend(spans[position:start])
+        if end > start:
+            span = (spans[start][0], spans[end - 1][1])
+        else:
+            span = (source_start(start), source_start(start))
+        result.extend([span] * replacement_length)
+        position = end
+    result.extend(spans[position:])
+    return result
+
+
+def check_map(offsets, spans, source_length):
+    assert len(offsets) == len(spans)
+    starts, ends = offsets.to_arrays()
+    assert list(zip(starts, ends)) == spans
+    for start in range(len(spans) + 1):
+        position = spans[start][0] if start < len(spans) else source_length
+        assert offsets.span(start, start) == (position, position)
+        for end in range(start + 1, len(spans) + 1):
+            assert offsets.span(start, end) == (spans[start][0], spans[end - 1][1])
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_compose_chains_like_per_character_spans(seed):
+    generator = random.Random(seed)
+    source_length = generator.randint(0, 12)
+    offsets = OffsetMap(source_length)
+    spans = [(position, position + 1) for position in range(source_length)]
+    check_map(offsets, spans, source_length)
+    for _ in range(generator.randint(1, 5)):
+        edits = random_edits(generator, len(spans))
+        spans = apply_edits(spans, edits, source_length)
+        offsets = offsets.compose(edits, len(spans))
+        check_map(offsets, spans, source_length)
+
+
+def test_deletions_and_insertions():
+    offsets = OffsetMap(6)
+    # "abcdef" -> "aXYcf": b becomes XY, d and e are deleted
+    offsets = offsets.compose([(1, 2, 2), (3, 5, 0)], 5)
+    assert offsets.span(0) == (0, 1)
+    assert offsets.span(1) == offsets.span(2) == (1, 2)
+    assert offsets.span(3) == (2, 3)
+    assert offsets.span(4) == (5, 6)
+    assert offsets.span(3, 5) == (2, 6)
+    # an insertion at the end maps to an empty span at the end of the source
+    offsets = offsets.compose([(5, 5, 1)], 6)
+    assert offsets.span(5) == (6, 6)
+    assert offsets.span(0, 6) == (0, 6)
+
+
+def test_empty_texts():
+    offsets = OffsetMap(0)
+    assert len(offsets) == 0
+    assert offsets.span(0, 0) == (0, 0)
+    assert [list(array) for array in offsets.to_arrays()] == [[], []]
+    offsets = OffsetMap(3).compose([(0, 3, 0)], 0)
+    assert len(offsets) == 0
+    assert offsets.span(0, 0) == (3, 3)
+    offsets = OffsetMap(0).compose([(0, 0, 2)], 2)
+    assert offsets.span(0, 2) == (0, 0)
+
+
+def test_substitution_edits_match_its_output():
+    substitution = Substitution(re.compile("b+|(?=c)"), lambda match: "X" * (len(match.group()) + 1))
+    text = "abbcabc"
+    output, offsets = substitution.align(text, OffsetMap(len(text)))
+    assert output == substitution(text)
+    for position, character in enumerate(output):
+        start, end = offsets.span(position)
+        if character != "X":
+            assert text[start:end] == character
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"convert_date": True, "english_correction": True, "phone_conversion": True},
+    {"hazm": False, "remove_punct": False, "keep_allowed_chars": False},
+])
+def test_normalize_with_offsets(normalizer, options):
+    for text in TEXTS + generate_corpus(200):
+        output, offsets = normalizer.normalize_with_offsets(text, **options)
+        assert output == normalizer.normalize(text, **options)
+        assert len(offsets) == len(output)
+        assert offsets.source_length == len(text)
+        starts, ends = offsets.to_arrays()
+        previous = 0
+        for position in range(len(output)):
+            start, end = offsets.span(position)
+            assert (start, end) == (starts[position], ends[position])
+            assert previous <= start <= end <= len(text)
+            previous = start
+
+
+@pytest.mark.parametrize("version", ["0.11.0", None])
+def test_unknown_hazm_is_aligned_by_diffing(normalizer, monkeypatch, version):
+    monkeypatch.setattr(hazm_alignment, "hazm_version", lambda: version)
+    stage = hazm_alignment.HazmNormalization(normalizer.hazm_norm)
+    with pytest.warns(RuntimeWarning, match="diffing"):
+        assert not stage.supported
+    for text in TEXTS:
+        output, offsets = stage.align(text, OffsetMap(len(text)))
+        assert output == normalizer.hazm_norm.normalize(text)
+        assert len(offsets) == len(output)
+
+
+def test_normalizer_without_a_replayed_attribute_is_aligned_by_diffing(normalizer):
+    class Normalizer:
+        def normalize(self, text):
+            return normalizer.hazm_norm.normalize(text)
+
+    stage = hazm_alignment.HazmNormalization(Normalizer())
+    with pytest.warns(RuntimeWarning):
+        output, offsets = stage.align(TEXTS[5], OffsetMap(len(TEXTS[5])))
+    assert output == normalizer.hazm_norm.normalize(TEXTS[5])
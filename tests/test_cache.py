@@ -0,0 +1,39 @@
+import pytest
+
+from parsnorm import ParsNorm
+
+
+def test_disk_cache_refuses_random_readings(tmp_path):
+    with pytest.raises(ValueError, match="template_policy"):
+        ParsNorm(disk_cache=tmp_path / "cache.sqlite3")
+
+
+def test_disk_cache_keeps_reproducible_readings(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    text = "ساعت 12:30 تاریخ 1402/5/12 و 123"
+    expected = ParsNorm(template_policy="hash").normalize(text, convert_date=True)
+    assert ParsNorm(template_policy="hash", disk_cache=path).normalize(text, convert_date=True) == expected
+    assert ParsNorm(template_policy="hash", disk_cache=path).normalize(text, convert_date=True) == expected
+
+
+def test_result_cache_refuses_random_readings():
+    with pytest.raises(ValueError, match="template_policy"):
+        ParsNorm(result_cache_size=16)
+
+
+def test_result_cache_keeps_reproducible_readings():
+    normalizer = ParsNorm(template_policy="hash", result_cache_size=16)
+    text = "ساعت 12:30 و 123"
+    assert normalizer.normalize(text) == normalizer.normalize(text) == ParsNorm(template_policy="hash").normalize(text)
+    assert normalizer.cache_info()["hits"] == 1
+
+
+def test_prune_with_both_caches(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    ParsNorm(template_policy="hash", template_seed=1, disk_cache=path).normalize("سلام 12")
+    normalizer = ParsNorm(template_policy="hash", result_cache_size=16, disk_cache=path)
+    normalizer.normalize("سلام 12")
+    # the entry of the other configuration goes, this instance's entry stays
+    assert normalizer.result_cache.prune() == 1
+    assert normalizer.result_cache.prune() == 0
+    assert normalizer.cache_info()["levels"][1]["entries"] == 1
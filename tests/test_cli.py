@@ -0,0 +1,36 @@
+import json
+import subprocess
+import sys
+
+from benchmarks.corpus import generate_corpus
+from parsnorm import ParsNorm
+
+
+def test_blank_jsonl_lines_stay_in_place():
+    lines = [json.dumps({"text": "سلام 12", "id": 1}), "", json.dumps({"text": "ساعت 8:30", "id": 2}), "  "]
+    normalizer = ParsNorm(template_policy="fixed")
+    results = list(normalizer.normalize_stream(lines, workers=1, field="text"))
+    assert results[1] is None and results[3] is None
+    assert [result["id"] for result in (results[0], results[2])] == [1, 2]
+    assert results[0]["text"] == normalizer.normalize("سلام 12")
+
+
+def test_cli_stops_quietly_when_its_reader_goes_away(tmp_path):
+    source = tmp_path / "corpus.txt"
+    source.write_text("\n".join(generate_corpus(3000)) + "\n", encoding="utf-8")
+    process = subprocess.Popen([sys.executable, "-m", "parsnorm", str(source), "--workers", "1"],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert process.stdout.readline()
+    process.stdout.close()
+    _, errors = process.communicate(timeout=120)
+    assert process.returncode == 0, errors.decode()
+    assert b"Traceback" not in errors
+
+
+def test_cli_keeps_jsonl_lines_aligned(tmp_path):
+    source = tmp_path / "manifest.jsonl"
+    source.write_text(json.dumps({"text": "سلام"}) + "\n\n" + json.dumps({"text": "12"}) + "\n", encoding="utf-8")
+    output = subprocess.run([sys.executable, "-m", "parsnorm", str(source), "--field", "text", "--workers", "1"],
+                            capture_output=True, check=True, timeout=120).stdout.decode("utf-8")
+    lines = output.split("\n")
+    assert lines[1] == "" and json.loads(lines[2])["text"] == "دوازده"
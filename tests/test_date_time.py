@@ -0,0 +1,107 @@
+import pytest
+
+from parsinorm.date_time_to_text import Date_time_to_text
+from parsinorm.template_selector import Template_selector
+
+
+YEAR_1402 = "دوازدهم جمادی الاول سال هزار و چهارصد و دو"
+
+
+@pytest.fixture(scope="module")
+def date_time():
+    return Date_time_to_text(Template_selector("fixed"))
+
+
+@pytest.mark.parametrize("text", [
+    "1402/5/12",
+    "1402 / 5 / 12",
+    "1402/ 5 /12",
+    "1402.5.12",
+    "1402-5-12",
+    "۱۴۰۲/۵/۱۲",
+    "١٤٠٢/٥/١٢",
+    "۱۴۰۲/5/12",
+    "12/5/1402",
+])
+def test_separator_forms(date_time, text):
+    assert date_time.date_to_text(text) == YEAR_1402
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("98/8/12", "دوازدهم آبان سال نود و هشت"),
+    ("12/5/98", "دوازدهم مرداد سال نود و هشت"),
+    ("2023-6-22", "بیست و دوم ژوئن سال دو هزار و بیست و سه"),
+])
+def test_calendars(date_time, text, expected):
+    assert date_time.date_to_text(text) == expected
+
+
+def test_every_date_of_a_sentence_is_read(date_time):
+    text = "تاریخ 1402/5/12 و 1399/11/9 و ۱۳۹۸/۰۱/۰۵"
+    assert date_time.date_to_text(text) == (
+        "تاریخ " + YEAR_1402
+        + " و نهم بهمن سال هزار و سیصد و نود و نه"
+        + " و پنجم فروردین سال هزار و سیصد و نود و هشت")
+
+
+@pytest.mark.parametrize("parts, expected", [
+    (("1402", "5", "12"), ("1402", "5", "12")),
+    (("1402", "05", "12"), ("1402", "5", "12")),
+    (("12", "5", "1402"), ("1402", "5", "12")),
+    (("98", "8", "12"), ("98", "8", "12")),
+    (("12", "5", "98"), ("98", "5", "12")),
+    (("98", "5", "012"), ("98", "5", "12")),
+])
+def test_split_date(date_time, parts, expected):
+    assert date_time.split_date(*parts) == expected
+
+
+@pytest.mark.parametrize("parts", [
+    ("1402", "13", "1"),
+    ("1402", "0", "5"),
+    ("0", "5", "1402"),
+    ("1402", "5", "0"),
+    # no part can be the year
+    ("12", "5", "30"),
+    ("12", "8", "30"),
+])
+def test_split_date_rejects(date_time, parts):
+    assert date_time.split_date(*parts) is None
+
+
+@pytest.mark.parametrize("text", [
+    "1402/13/1",
+    "1402/0/5",
+    "12/5/30",
+    # the two separators of a date are the same
+    "1402/5.12",
+    "1402-5/12",
+    "2.5.3",
+    "قیمت 3.14 تومان",
+])
+def test_non_dates_are_kept(date_time, text):
+    assert date_time.date_to_text(text) == date_time.number_correction(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("8:30:15", "هشت و سی دقیقه و  پانزده ثانیه"),
+    ("23:59:59", "بیست و سه و پنجاه و نه دقیقه و  پنجاه و نه ثانیه"),
+    ("0:0:5", "پنج ثانیه بامداد"),
+    ("0:30", "سی دقیقه  بامداد"),
+    # an invalid second keeps its suffix after the hour and minute reading
+    ("12:30:75", "دوازده و سی دقیقه  :75"),
+    ("30:0", "30:0"),
+    ("24:00", "24:00"),
+    ("ساعت 8:30 تا 17:45", "ساعت هشت و سی دقیقه   تا هفده و چهل و پنج دقیقه  "),
+])
+def test_time_to_text(date_time, text, expected):
+    assert date_time.time_to_text(text) == expected
+
+
+def test_time_readings_are_cached():
+    date_time = Date_time_to_text(Template_selector("fixed"))
+    assert date_time.time_to_text("8:30:15 و 8:30:15") == "هشت و سی دقیقه و  پانزده ثانیه و هشت و سی دقیقه و  پانزده ثانیه"
+    assert date_time.time_to_text("12:30:75") == "دوازده و سی دقیقه  :75"
+    assert set(date_time.time_texts) == {(8, 30, 15, 0), (12, 30, None, 0)}
+    date_time.time_texts[8, 30, 15, 0] = "cached"
+    assert date_time.time_to_text("8:30:15") == "cached"
@@ -0,0 +1,30 @@
+import pytest
+
+from parsinorm.general_normalization import General_normalization
+from parsnorm import ParsNorm
+from parsnorm.alignment import OffsetMap
+
+
+@pytest.fixture(scope="module")
+def general_normalization():
+    return General_normalization()
+
+
+@pytest.fixture(scope="module")
+def plan():
+    return ParsNorm(template_policy="fixed").compile()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("۱٬۲۳۴ تومان", "۱۲۳۴ تومان"),
+    ("۳٫۱۴", "۳۱۴"),
+    # every separator of a number goes, not only the first of each run
+    ("۱٬۲۳۴٬۵۶۷", "۱۲۳۴۵۶۷"),
+    ("۱٬۲۳۴٬۵۶۷ و ۴٬۵", "۱۲۳۴۵۶۷ و ۴۵"),
+    ("سال ۱۴۰۲، ۱۴۰۳", "سال ۱۴۰۲، ۱۴۰۳"),
+    ("٬۱۲ و ۱۲٬", "٬۱۲ و ۱۲٬"),
+])
+def test_remove_comma_between_digits(general_normalization, plan, text, expected):
+    assert general_normalization.remove_comma_between_digits(text) == expected
+    stage = dict(plan.stages)["comma_between_numbers_removal"]
+    assert stage(text) == stage.align(text, OffsetMap(len(text)))[0] == expected
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from parsinorm.number_words import words, ordinal_words, cardinal_words
+
+num2fawords = pytest.importorskip("num2fawords")
+num2words = pytest.importorskip("num2words")
+
+PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+
+def sample_integers():
+    generator = random.Random(0)
+    numbers = list(range(0, 2100)) + [10 ** power + offset for power in range(3, 25) for offset in (-1, 0, 1)]
+    numbers += [generator.randrange(10 ** digits) for digits in range(4, 30) for _ in range(40)]
+    return numbers
+
+
+def sample_decimals():
+    generator = random.Random(1)
+    return ["{}.{}".format(generator.randrange(10 ** generator.randint(1, 6)),
+                           str(generator.randrange(1, 10 ** places)).zfill(places))
+            for places in range(1, 8) for _ in range(150)]
+
+
+def test_words_matches_num2fawords():
+    for number in sample_integers():
+        assert words(number) == num2fawords.words(number), number
+        assert words(-number) == num2fawords.words(-number), -number
+        assert words(str(number)) == num2fawords.words(str(number)), number
+        persian = str(number).translate(PERSIAN_DIGITS)
+        assert words(persian) == num2fawords.words(persian), persian
+
+
+def test_decimal_words_match_num2fawords():
+    for number in sample_decimals():
+        assert words(number) == num2fawords.words(number), number
+        assert words("-" + number) == num2fawords.words("-" + number), number
+        persian = number.translate(PERSIAN_DIGITS)
+        assert words(persian) == num2fawords.words(persian), persian
+
+
+def test_ordinal_words_match_num2fawords():
+    for number in sample_integers():
+        assert ordinal_words(number) == num2fawords.ordinal_words(number), number
+
+
+def test_cardinal_words_match_num2words():
+    # up to 2 ** 53 the float num2words reads a number through is exact
+    for number in sample_integers():
+        if number < 2 ** 53:
+            expected = num2words.num2words(float(number), lang="fa")
+            assert cardinal_words(number) == expected, number
+            assert cardinal_words(str(number)) == expected, number
+            assert cardinal_words(str(number).translate(PERSIAN_DIGITS)) == expected, number
+
+
+def test_cardinal_decimal_words_match_num2words():
+    for number in sample_decimals():
+        if len(number.replace(".", "")) > 15 or number.rstrip("0").endswith("05"):
+            continue
+        assert cardinal_words(number) == num2words.num2words(float(number), lang="fa"), number
+
+
+def test_long_integers_keep_every_digit():
+    number = 123456789012345678
+    expected = num2words.num2words(number, lang="fa")
+    assert cardinal_words(number) == cardinal_words(str(number)) == expected
+    # the float the old conversion went through rounds the last digits away
+    assert num2words.num2words(float(number), lang="fa") != expected
+    assert words(number) == words(str(number)) == num2fawords.words(number)
+
+
+@pytest.mark.parametrize("number, expected, num2words_reading", [
+    # num2words reads .05 and .005 like .5, as one half
+    ("0.05", "پنج صدم", "نیم"),
+    ("1.05", "یک و پنج صدم", "یک و نیم"),
+    ("2.005", "دو و پنج هزارم", "دو و نیم"),
+    ("1.5", "یک و نیم", "یک و نیم"),
+    ("0.5", "نیم", "نیم"),
+])
+def test_one_half(number, expected, num2words_reading):
+    assert cardinal_words(number) == expected
+    assert num2words.num2words(float(number), lang="fa") == num2words_reading
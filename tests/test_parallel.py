@@ -0,0 +1,30 @@
+from benchmarks.corpus import generate_corpus
+from parsnorm import ParsNorm
+
+
+def test_workers_are_kept_between_calls():
+    texts = generate_corpus(40)
+    with ParsNorm(template_policy="hash") as normalizer:
+        expected = [normalizer.normalize(text) for text in texts]
+        assert normalizer.normalize_batch(texts, workers=2) == expected
+        pools = dict(normalizer._pools)
+        assert len(pools) == 1
+        assert normalizer.normalize_batch(texts[:10], workers=2) == expected[:10]
+        assert list(normalizer.normalize_stream(texts, workers=2, chunksize=8)) == expected
+        assert normalizer._pools == pools
+        # another option set gets its own workers
+        normalizer.normalize_batch(texts, workers=2, hazm=False)
+        assert len(normalizer._pools) == 2
+    assert normalizer._pools == {}
+    # a closed instance starts new workers when needed
+    assert normalizer.normalize_batch(texts, workers=2) == expected
+    normalizer.close()
+
+
+def test_interrupted_stream_leaves_the_pool_usable():
+    texts = generate_corpus(60)
+    with ParsNorm(template_policy="hash") as normalizer:
+        stream = normalizer.normalize_stream(texts, workers=2, chunksize=4)
+        next(stream)
+        stream.close()
+        assert normalizer.normalize_batch(texts, workers=2) == [normalizer.normalize(text) for text in texts]
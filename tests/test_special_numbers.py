@@ -0,0 +1,63 @@
+import pytest
+
+from parsinorm.special_numbers import Special_numbers
+from parsinorm.template_selector import Template_selector
+
+
+@pytest.fixture(scope="module")
+def special_numbers():
+    return Special_numbers(Template_selector("fixed"))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("12", " دوازده "),
+    ("۱۲۳", " صد و بیست و سه "),
+    ("قیمت 1200 تومان", "قیمت  هزار و دویست  تومان"),
+    ("سال 3 و 13", "سال  سه  و  سیزده "),
+    ("1234567890123456789", "   دوازده   سی و چهار   پنجاه و شش   هفتاد و هشت   نود   دوازده   سی و چهار"
+                            "   پنجاه و شش   هفتصد و هشتاد و نه "),
+])
+def test_integers(special_numbers, text, expected):
+    assert special_numbers.convert_numbers_to_text(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("کد 007", "کد  هفت "),
+    ("0012 و 12", " دوازده  و  دوازده "),
+])
+def test_leading_zeros_are_not_read(special_numbers, text, expected):
+    assert special_numbers.convert_numbers_to_text(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("صفحه 12-15", "صفحه  دوازده خط تیره پانزده "),
+    ("صفحه ۱۲ - ۱۵", "صفحه  دوازده  خط تیره  پانزده "),
+    ("10-20 و 3-4", " ده خط تیره بیست  و  سه خط تیره چهار "),
+    # one end of a range is not read inside the other
+    ("1-12", " یک خط تیره دوازده "),
+    # once a sentence has a range every hyphen in it is read
+    ("12-15 و a-b", " دوازده خط تیره پانزده  و aخط تیرهb"),
+])
+def test_ranges(special_numbers, text, expected):
+    assert special_numbers.convert_numbers_to_text(text) == expected
+
+
+def test_hyphens_without_a_range_are_kept(special_numbers):
+    assert special_numbers.convert_numbers_to_text("a-b 12") == "a-b  دوازده "
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("3.14", "سه ممیز چهارده صدم"),
+    ("12.50", "دوازده ممیز پنجاه صدم"),
+    ("2.25 و 25.2", "دو ممیز بیست و پنج صدم و بیست و پنج ممیز دو دهم"),
+    ("5 و 1.5", " پنج  و یک ممیز پنج دهم"),
+    # a zero fraction reads the integer part only
+    ("12.0", " دوازده "),
+    # like num2fawords, a zero integer part in Persian digits is not read
+    ("0.05", " ممیز پنج صدم"),
+    # at most ten integer and four fraction digits are read
+    ("1234567.123456", "یک میلیون و دویست و سی و چهار هزار و پانصد و شصت و هفت ممیز"
+                       " یک هزار و دویست و سی و چهار ده هزارم"),
+])
+def test_decimals(special_numbers, text, expected):
+    assert special_numbers.convert_numbers_to_text(text) == expected
@@ -0,0 +1,54 @@
+import pytest
+
+from parsinorm.telephone_number import Telephone_number
+from parsinorm.template_selector import Template_selector
+
+
+TEHRAN_88888888 = "   صفر بیست و یک-  هشتصد و هشتاد و هشت هشتصد و هشتاد و هشت هشتاد و هشت"
+MOBILE = "  صفر نهصد و دوازده صد و بیست و سه چهل و پنج شصت و هفت"
+
+
+@pytest.fixture(scope="module")
+def telephone_number():
+    return Telephone_number(Template_selector("fixed"))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("تلفن +989121234567", "تلفن   دو صفر نود و هشت نود و یک بیست و یک بیست و سه چهل و پنج شصت و هفت"),
+    ("تلفن +98", "تلفن   دو صفر نود و هشت"),
+])
+def test_country_code(telephone_number, text, expected):
+    assert telephone_number.find_phones_replace(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("021-88888888", TEHRAN_88888888),
+    ("تلفن 021-88888888", "تلفن " + TEHRAN_88888888),
+    ("تلفن: 021-88888888", "تلفن: " + TEHRAN_88888888),
+    ("تلفن 021 - 88888888", "تلفن    صفر بیست و یک -   هشتصد و هشتاد و هشت هشتصد و هشتاد و هشت هشتاد و هشت"),
+    ("02188888888", "  صفر  بیست و یک هشتصد و هشتاد و هشت هشتصد و هشتاد و هشت هشتاد و هشت"),
+])
+def test_tehran_area_code(telephone_number, text, expected):
+    assert telephone_number.find_phones_replace(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("09121234567", MOBILE),
+    ("شماره تماس: 09121234567", "شماره تماس: " + MOBILE),
+    ("فکس 88888888", "فکس   هشتصد و هشتاد و هشت هشتصد و هشتاد و هشت هشتاد و هشت"),
+    ("تلفن های 88888888 و 77777777", "تلفن های   هشتصد و هشتاد و هشت هشتصد و هشتاد و هشت هشتاد و هشت و"
+                                     "   هفتصد و هفتاد و هفت هفتصد و هفتاد و هفت هفتاد و هفت"),
+    ("سامانه پیامکی: 3000", "سامانه پیامکی:   سی  دو صفر "),
+])
+def test_cues_and_prefixes(telephone_number, text, expected):
+    assert telephone_number.find_phones_replace(text) == expected
+
+
+def test_every_phone_of_a_sentence_is_read(telephone_number):
+    text = "تماس 09121234567 یا 021-66554433"
+    assert telephone_number.find_phones_replace(text) == (
+        "تماس " + MOBILE + " یا    صفر بیست و یک-  ششصد و شصت و پنج پانصد و چهل و چهار سی و سه")
+
+
+def test_other_numbers_are_kept(telephone_number):
+    assert telephone_number.find_phones_replace("قیمت 1200") == "قیمت ۱۲۰۰"
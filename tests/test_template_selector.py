@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from parsinorm.date_time_to_text import Date_time_to_text
+from parsinorm.template_selector import Template_selector
+
+
+KEYS = ["1402/5/12", "8:30", "09121234567", "۱۲۳۴۵۶۷۸۹۰", 1402, ""]
+COUNTS = [2, 3, 7, 10, 16]
+
+CHOICES = """
+import json, sys
+from parsinorm.template_selector import Template_selector
+selector = Template_selector(sys.argv[1], seed=int(sys.argv[2]))
+keys = json.loads(sys.argv[3])
+print(json.dumps([selector.choose(count, key) for key in keys for count in {counts}]))
+""".format(counts=COUNTS)
+
+
+def choices(selector, keys=KEYS):
+    return [selector.choose(count, key) for key in keys for count in COUNTS]
+
+
+def choices_in_a_process(policy, seed, hash_seed):
+    environment = dict(os.environ, PYTHONHASHSEED=str(hash_seed))
+    output = subprocess.run([sys.executable, "-c", CHOICES, policy, str(seed), json.dumps(KEYS)],
+                            capture_output=True, text=True, check=True, env=environment,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    return json.loads(output)
+
+
+def test_fixed_always_picks_the_first_template():
+    selector = Template_selector("fixed", seed=5)
+    assert set(choices(selector) * 3) == {0}
+    assert selector.deterministic
+
+
+@pytest.mark.parametrize("seed", [0, 7])
+def test_hash_is_reproducible(seed):
+    expected = choices(Template_selector("hash", seed))
+    assert choices(Template_selector("hash", seed)) == expected
+    # the order of the calls does not matter
+    selector = Template_selector("hash", seed)
+    assert choices(selector, KEYS[::-1]) == choices(Template_selector("hash", seed), KEYS[::-1])
+    assert choices(selector) == expected
+    for hash_seed in (1, 2):
+        assert choices_in_a_process("hash", seed, hash_seed) == expected
+
+
+def test_hash_depends_on_the_seed():
+    keys = [str(number) for number in range(50)]
+    assert choices(Template_selector("hash", 0), keys) != choices(Template_selector("hash", 1), keys)
+
+
+@pytest.mark.parametrize("seed", [0, 7])
+def test_seed_is_reproducible_for_the_same_calls(seed):
+    expected = choices(Template_selector("seed", seed))
+    assert choices(Template_selector("seed", seed)) == expected
+    for hash_seed in (1, 2):
+        assert choices_in_a_process("seed", seed, hash_seed) == expected
+    assert not Template_selector("seed", seed).deterministic
+
+
+def test_choices_are_in_range():
+    for policy in Template_selector.POLICIES:
+        selector = Template_selector(policy)
+        for count in COUNTS:
+            assert all(0 <= selector.choose(count, key) < count for key in KEYS)
+        assert selector.choose(1, "key") == 0
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError, match="policy must be one of"):
+        Template_selector("sorted")
+
+
+def test_hash_reads_a_value_the_same_everywhere():
+    text = "تاریخ 1402/5/12 و 1399/11/9 و 2023-6-22"
+    first = Date_time_to_text(Template_selector("hash", 3))
+    second = Date_time_to_text(Template_selector("hash", 3))
+    expected = first.date_to_text(text)
+    # a value read earlier, and memoized, reads the same in a sentence
+    second.date_to_text("1399/11/9")
+    assert second.date_to_text(text) == expected
@@ -0,0 +1,86 @@
+import pytest
+
+from parsinorm.tokenizer import Tokenizer
+
+
+@pytest.fixture(scope="module")
+def tokenizer():
+    return Tokenizer()
+
+
+# the tokens of the previous, placeholder based word_tokenize
+@pytest.mark.parametrize("text, expected", [
+    ("سلام، حال شما چطور است؟", ["سلام", "،", "حال", "شما", "چطور", "است", "؟"]),
+    ("قیمت 12.5 دلار (تقریبا) بود!", ["قیمت", "12.5", "دلار", "(", "تقریبا", ")", "بود", "!"]),
+    ("ساعت 12:30 و تاریخ 1402/5/12", ["ساعت", "12:30", "و", "تاریخ", "1402/5/12"]),
+    ("«نقل قول» [یک] {دو}", ["«", "نقل", "قول", "»", "[", "یک", "]", "{", "دو", "}"]),
+    ("۱۲۳٫۴", ["۱۲۳", "٫", "۴"]),
+    ("کتاب‌ها را ۱۲ بار خواندم", ["کتاب‌ها", "را", "۱۲", "بار", "خواندم"]),
+    ("😀سلام😀", ["😀", "سلام", "😀"]),
+    ("این iPhoneها خوبند", ["این", "iPhone", "ها", "خوبند"]),
+    ("سلامhello", ["سلام", "hello"]),
+    ("aسلام b aسلام", ["a", "سلام", "b", "a", "سلام"]),
+    ("ایمیل من test@mail.com است", ["ایمیل", "من", "test@mail.com", "است"]),
+    ("a@b.com و c@d.com و a@b.com", ["a@b.com", "و", "c@d.com", "و", "a@b.com"]),
+    ("سایت https://example.com/a?b=1 را ببینید", ["سایت", "https://example.com/a?b=1", "را", "ببینید"]),
+    ("www.site.com/x و www.site.com/x", ["www.site.com/x", "و", "www.site.com/x"]),
+    ("متن https://a.com/bسلام", ["متن", "https://a.com/bسلام"]),
+    ("#ایران و #iran و @user_name", ["#ایران", "و", "iran#", "و", "@user_name"]),
+    ("#tag #tag", ["tag#", "tag#"]),
+    ("#aسلام و #aسلام", ["#aسلام", "و", "#aسلام"]),
+    ("#سلام،دنیا", ["#سلام", "،", "دنیا"]),
+    ("سلام#tag", ["سلام", "tag#"]),
+    ("@user1سلام", ["@", "user", "1", "سلام"]),
+])
+def test_word_tokenize(tokenizer, text, expected):
+    assert tokenizer.word_tokenize(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    # placeholders glued to other text used to be left in the tokens
+    ("x@y.comسلام", ["x@y.com", "سلام"]),
+    # and one matching a placeholder of the text had nothing to restore
+    ("HHAASHSHTTAAGG #a", ["HHAASHSHTTAAGG", "a#"]),
+])
+def test_word_tokenize_keeps_the_text(tokenizer, text, expected):
+    assert tokenizer.word_tokenize(text) == expected
+
+
+def test_word_tokenize_offsets(tokenizer):
+    text = "قیمت 12.5 دلار و #iran"
+    offsets = tokenizer.word_tokenize(text, offsets=True)
+    assert offsets == [(0, 4), (5, 9), (10, 14), (15, 16), (17, 22)]
+    assert [text[start:end] for start, end in offsets] == ["قیمت", "12.5", "دلار", "و", "#iran"]
+
+
+# the sentences of the previous sentence_tokenize
+SENTENCES = [
+    ("سلام. حال شما چطور است؟ خوبم!", ["سلام .", " حال شما چطور است ؟", " خوبم !"]),
+    ("قیمت 12.5 دلار است. بعد", ["قیمت 12.5 دلار است .", " بعد"]),
+    ("دکتر ع.م. رفت. آمد", ["دکتر ع.م. رفت .", " آمد"]),
+    ("U.S.A. is big. ok", ["U.S.A. is big .", " ok"]),
+    ("ایمیل a.b@c.com است. بعد", ["ایمیل a.b@c.com است .", " بعد"]),
+    ("اول:\nدوم؛\nسوم\n\nچهارم", ["اول :", "دوم ؛", "سوم ", "چهارم"]),
+]
+
+# numbers inside urls and emails, whose sentinels used to leak
+LEAKED = [
+    ("سایت www.site2.com/page1 است. بعد", ["سایت www.site2.com/page1 است .", " بعد"]),
+    ("عدد 3 در https://x.com/a1.b2 بود. بعد", ["عدد 3 در https://x.com/a1.b2 بود .", " بعد"]),
+    ("ایمیل user1@mail2.com. بعد", ["ایمیل user1@mail2.com .", " بعد"]),
+    ("آدرس http://a.com/x.1 و 2.5 است.", ["آدرس http://a.com/x.1 و 2.5 است ."]),
+]
+
+
+@pytest.mark.parametrize("text, expected", SENTENCES + LEAKED)
+def test_sentence_tokenize(tokenizer, text, expected):
+    assert tokenizer.sentence_tokenize(text, False) == expected
+    assert list(tokenizer.iter_sentences(text)) == expected
+
+
+def test_iter_sentences_reads_a_file_by_line(tokenizer, tmp_path):
+    text = "\n".join(text for text, _ in SENTENCES + LEAKED) + "\n\n\nپایان. "
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding="utf-8")
+    with open(path, encoding="utf-8") as file:
+        assert list(tokenizer.iter_sentences(file)) == tokenizer.sentence_tokenize(text, False)